@@ -27,16 +27,98 @@ from __future__ import annotations
 
 __version__ = "1.0.8"
 
+# Note: These are imported under private names, so that they do not show up as
+#       attributes of the package (e.g. in `dir(oscana)`).
+
+from typing import Any as _Any
+
+import sys as _sys
+from types import ModuleType as _ModuleType
+from importlib import import_module as _import_module
+
 from .constants import *
 from .errors import *
 from .images import *
 from .logger import *
-from .plotting import *
-from .themes import *
 from .utils import *
 
 from . import data
 
+# ========================= [ Lazy Plotting Import ] ========================= #
+
+# Note: Importing Matplotlib is quite slow, so the plotting and themes modules
+#       are only imported when one of their names is first accessed. This way,
+#       users who only load data do not pay for it.
+
+_LAZY_MODULES: tuple[str, ...] = ("plotting", "themes")
+
+_LAZY_NAMES: frozenset[str] = frozenset(
+    [
+        *_LAZY_MODULES,
+        # Plotting
+        "MINOS_GUESSED_ENERGY_BINS",
+        "plotting_context",
+        "grid_layout",
+        "spectrum_layout",
+        "fd_uv_views_layout",
+        "energy_axs_scale",
+        "spec_fig_cleanup",
+        "plot_hist",
+        "plot_energy_resolution",
+        "plot_fd_event_image",
+        "get_bin_centers",
+        # Themes
+        "Theme",
+        "themes",
+    ]
+)
+
+
+def _bind_lazy_names(module: _ModuleType) -> None:
+    """\
+    [ Internal ] Bind the public names of a lazy module to the package.
+    """
+    globals().update({attr: getattr(module, attr) for attr in module.__all__})
+
+
+class _OscanaModule(_ModuleType):
+    """\
+    [ Internal ] Module type of the package.
+
+    Notes
+    -----
+    The import system binds a submodule as an attribute of the package once it
+    has been imported (e.g. `import oscana.plotting` also imports and binds
+    `oscana.themes`). This would replace the dictionary of themes with the
+    module, so the public names of the lazy modules are bound again here.
+    """
+
+    def __setattr__(self, name: str, value: _Any) -> None:
+        super().__setattr__(name, value)
+
+        if name in _LAZY_MODULES and isinstance(value, _ModuleType):
+            _bind_lazy_names(value)
+
+
+_sys.modules[__name__].__class__ = _OscanaModule
+
+
+def __getattr__(name: str) -> _Any:
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    # Note: This mimics `from .plotting import *` followed by `from .themes
+    #       import *`, so `oscana.themes` is the dictionary of themes.
+
+    for module_name in _LAZY_MODULES:
+        _bind_lazy_names(_import_module(f".{module_name}", __name__))
+
+    return globals()[name]
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_NAMES)
+
 
 def get_version() -> str:
     """\
@@ -72,7 +154,10 @@ def print_version(fancy: bool = False) -> None:
 
 
 def init(
-    logs_dir="./", verbosity="WARNING", config_file: str | None = None
+    logs_dir="./",
+    verbosity="WARNING",
+    config_file: str | None = None,
+    print_banner: bool = False,
 ) -> None:
     """\
     Initialise the Oscana package.
@@ -88,6 +173,9 @@ def init(
     config_file : str, optional
         Path to the config file, by default None
 
+    print_banner : bool, optional
+        Whether to print the Oscana version banner, by default False
+
     Notes
     -----
     You can also call Oscana `init_*` functions separately.
@@ -98,5 +186,5 @@ def init(
     init_env_variables()
     init_minos_numbers()
 
-
-print_version(fancy=True)
+    if print_banner:
+        print_version(fancy=True)
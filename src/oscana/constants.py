@@ -30,6 +30,8 @@ __all__ = [
     "IMAGE_SIGCOR_VARIABLES",
     "IMAGE_TIME_VARIABLES",
     "IMAGE_ALL_VARIABLES",
+    # SNTP Variable Dtypes
+    "SNTP_VARIABLE_DTYPES",
     # Enums
     "EIAction",
     "EIResonance",
@@ -38,7 +40,9 @@ __all__ = [
     "EPlaneView",
 ]
 
-from typing import Final, Literal
+from typing import Any, Final, Literal
+
+import sys
 from pathlib import Path
 import importlib.resources as resources
 from enum import Enum
@@ -48,15 +52,11 @@ import numpy as np
 # =========================== [ Package Constants ] ========================== #
 
 
-# Note: A better way to do this would be using `importlib.resources.files` but
-#       I am currenly using Python 3.8 which does not seem to have this feature.
-#       The other option is to use `pkg_resources` but it is deprecated! So, for
-#       now, I am using `importlib.resources.path` and going back two
-#       directories to get the resources folder.
-
+# Note: The resources folder sits two directories above the package directory,
+#       which we can get directly using `importlib.resources.files` (no need for
+#       the deprecated `importlib.resources.path` context manager).
 
-with resources.path("oscana", "") as _path:
-    RESOURCES_PATH = Path(_path).parent.parent / "res"
+RESOURCES_PATH = Path(resources.files("oscana")).parent.parent / "res"
 
 
 # ============================== [ Data Types ] ============================== #
@@ -72,19 +72,32 @@ SNTP_BR_FIT: Final[Literal["NtpFitSA"]] = "NtpFitSA"
 
 # ============================ [ SNTP Variables ] ============================ #
 
-SNTP_VR_DETECTOR: Final[str] = (
+# Note: The variable names are interned, so comparing them with each other (e.g.
+#       when looking up columns) is usually just an identity check. The branch
+#       prefix is written out (i.e. "NtpSt/..." rather than formatted from
+#       `SNTP_BR_STD`), so the names are plain constants in the bytecode.
+
+
+def _interned(*variables: str) -> list[str]:
+    """\
+    [ Internal ] Intern the given variable names.
+    """
+    return [sys.intern(variable) for variable in variables]
+
+
+SNTP_VR_DETECTOR: Final[str] = sys.intern(
     "NtpStRecord/RecRecordImp<RecCandHeader>/fHeader.RecPhysicsHeader/"
     "fHeader.RecDataHeader/fHeader.RecHeader/fHeader.fVldContext.fDetector"
 )
-SNTP_VR_SIM: Final[str] = (
+SNTP_VR_SIM: Final[str] = sys.intern(
     "NtpStRecord/RecRecordImp<RecCandHeader>/fHeader.RecPhysicsHeader"
     "/fHeader.RecDataHeader/fHeader.RecHeader/fHeader.fVldContext.fSimFlag"
 )
-SNTP_VR_RUN: Final[str] = (
+SNTP_VR_RUN: Final[str] = sys.intern(
     "NtpStRecord/RecRecordImp<RecCandHeader>/fHeader.RecPhysicsHeader"
     "/fHeader.RecDataHeader/fHeader.fRun"
 )
-SNTP_VR_EVT_UTC: Final[str] = (
+SNTP_VR_EVT_UTC: Final[str] = sys.intern(
     "NtpStRecord/RecRecordImp<RecCandHeader>/fHeader.RecPhysicsHeader/"
     "fHeader.RecDataHeader/fHeader.RecHeader/"
     "fHeader.fVldContext.fTimeStamp.fSec"
@@ -92,40 +105,52 @@ SNTP_VR_EVT_UTC: Final[str] = (
 
 # ====================== [ SNTP Variable Collections  ] ====================== #
 
-HEADER_VARIABLES: Final[list[str]] = [
-    f"{SNTP_BR_STD}/fHeader.fRun",  # Run number
-    f"{SNTP_BR_STD}/fHeader.fSubRun",  # Subrun number
-    f"{SNTP_BR_STD}/fHeader.fSnarl",  # Snarl number
-    f"{SNTP_BR_STD}/fHeader.fEvent",  # Event number
-]
+HEADER_VARIABLES: Final[list[str]] = _interned(
+    "NtpSt/fHeader.fRun",  # Run number
+    "NtpSt/fHeader.fSubRun",  # Subrun number
+    "NtpSt/fHeader.fSnarl",  # Snarl number
+    "NtpSt/fHeader.fEvent",  # Event number
+)
 
-IMAGE_BASIC_VARIABLES: Final[list[str]] = [
-    f"{SNTP_BR_STD}/stp.planeview",  # Plane view
-    f"{SNTP_BR_STD}/stp.strip",  # Strip number
-    f"{SNTP_BR_STD}/stp.plane",  # Plane number
-]
+IMAGE_BASIC_VARIABLES: Final[list[str]] = _interned(
+    "NtpSt/stp.planeview",  # Plane view
+    "NtpSt/stp.strip",  # Strip number
+    "NtpSt/stp.plane",  # Plane number
+)
 
-IMAGE_PE_VARIABLES: Final[list[str]] = [
-    f"{SNTP_BR_STD}/stp.ph0.pe",  # Photoelectrons (East)
-    f"{SNTP_BR_STD}/stp.ph1.pe",  # Photoelectrons (West)
-]
+IMAGE_PE_VARIABLES: Final[list[str]] = _interned(
+    "NtpSt/stp.ph0.pe",  # Photoelectrons (East)
+    "NtpSt/stp.ph1.pe",  # Photoelectrons (West)
+)
 
-IMAGE_SIGCOR_VARIABLES: Final[list[str]] = [
-    f"{SNTP_BR_STD}/stp.ph0.sigcor",  # Normalised strip response (East)
-    f"{SNTP_BR_STD}/stp.ph1.sigcor",  # Normalised strip response (West)
-]
+IMAGE_SIGCOR_VARIABLES: Final[list[str]] = _interned(
+    "NtpSt/stp.ph0.sigcor",  # Normalised strip response (East)
+    "NtpSt/stp.ph1.sigcor",  # Normalised strip response (West)
+)
+
+IMAGE_TIME_VARIABLES: Final[list[str]] = _interned(
+    "NtpSt/stp.time0",  # Charge weighted mean time [s] (East)
+    "NtpSt/stp.time1",  # Charge weighted mean time [s] (West)
+)
 
-IMAGE_TIME_VARIABLES: Final[list[str]] = [
-    f"{SNTP_BR_STD}/stp.time0",  # Charge weighted mean time [s] (East)
-    f"{SNTP_BR_STD}/stp.time1",  # Charge weighted mean time [s] (West)
+IMAGE_ALL_VARIABLES: Final[list[str]] = [
+    *IMAGE_BASIC_VARIABLES,
+    *IMAGE_PE_VARIABLES,
+    *IMAGE_SIGCOR_VARIABLES,
+    *IMAGE_TIME_VARIABLES,
 ]
 
-IMAGE_ALL_VARIABLES: Final[list[str]] = (
-    IMAGE_BASIC_VARIABLES
-    + IMAGE_PE_VARIABLES
-    + IMAGE_SIGCOR_VARIABLES
-    + IMAGE_TIME_VARIABLES
-)
+# ========================= [ SNTP Variable Dtypes ] ========================= #
+
+# Note: These are the variables which can be stored in single precision (i.e.
+#       `NUM_DTYPE`) without losing anything physically meaningful. Any other
+#       variable (e.g. the times, which need double precision) is kept in the
+#       precision that it was stored with in the file.
+
+SNTP_VARIABLE_DTYPES: Final[dict[str, type[np.generic]]] = {
+    **dict.fromkeys(IMAGE_PE_VARIABLES, NUM_DTYPE),
+    **dict.fromkeys(IMAGE_SIGCOR_VARIABLES, NUM_DTYPE),
+}
 
 # ================================ [ Enums  ] ================================ #
 
@@ -135,24 +160,65 @@ class _BaseEnum(Enum):
     [ Internal ] Base class for all Enums in the package.
     """
 
+    def __init__(self, *args: Any) -> None:
+        # Note: Enum members are singletons, so the string representations are
+        #       only created once (when the member is created).
+        self._str_cache: str = self.name.replace("_", " ").title()
+        self._repr_cache: str = f"oscana.{self.__class__.__name__}.{self.name}"
+
+    @classmethod
+    def _from_value(cls, value: Any) -> Any:
+        """\
+        [ Internal ] Get the member from its value.
+
+        Notes
+        -----
+        This is a single dictionary lookup (in the value to member map that
+        `Enum` already keeps), so it is faster than `cls(value)`. Unknown values
+        still go through `cls(value)` (i.e. `_missing_`).
+        """
+        try:
+            return cls._value2member_map_[value]
+        except KeyError:
+            return cls(value)
+
     def __str__(self) -> str:
-        return self.name.replace("_", " ").title()
+        return self._str_cache
 
     def __repr__(self) -> str:
-        return f"oscana.{self.__class__.__name__}.{self.name}"
+        return self._repr_cache
 
 
-class EIAction(_BaseEnum):
+class _BaseIntEnum(int, _BaseEnum):
+    """\
+    [ Internal ] Base class for all integer-valued Enums in the package.
+
+    Notes
+    -----
+    The members are also `int`s, so they can be compared with the integer codes
+    in the data (e.g. `df["mc.iaction"] == EIAction.CC`) and used directly in
+    NumPy arrays. They are formatted as integers when a format spec is given
+    (e.g. `f"{EIdHEP.MUON:d}"`), but `str` still gives the name.
+
+    This also means that members of different Enums with the same value are
+    equal (and have the same hash), e.g. `EIAction.NC == EInteraction.NC`, so
+    they should not be mixed as the keys of the same dictionary / set.
+    """
+
+    __format__ = int.__format__
+
+
+class EIAction(_BaseIntEnum):
     NC = 0
     CC = 1
     UNKNOWN = -1
 
     @classmethod
     def _missing_(cls, value: object) -> EIAction:
-        return cls(cls.UNKNOWN)
+        return cls.UNKNOWN
 
 
-class EIResonance(_BaseEnum):
+class EIResonance(_BaseIntEnum):
     QES = 1001  # Quasi-Elastic Scattering
     RES = 1002  # Resonance Production
     DIS = 1003  # Deep Inelastic Scattering
@@ -160,7 +226,7 @@ class EIResonance(_BaseEnum):
     IMD = 1005  # Inverse Muon Decay
 
 
-class EIdHEP(_BaseEnum):
+class EIdHEP(_BaseIntEnum):
     PHOTON = 22
     ELECTRON = 11
     MUON = 13
@@ -189,10 +255,10 @@ class EIdHEP(_BaseEnum):
 
     @classmethod
     def _missing_(cls, value: object) -> EIdHEP:
-        return cls(cls.UNKNOWN)
+        return cls.UNKNOWN
 
 
-class EInteraction(_BaseEnum):
+class EInteraction(_BaseIntEnum):
     """\
     Interaction Codes
 
@@ -221,10 +287,32 @@ class EInteraction(_BaseEnum):
 
     @classmethod
     def _missing_(cls, value: object) -> EInteraction:
-        return cls(cls.UNKNOWN)
+        return cls.UNKNOWN
+
+    @classmethod
+    def from_code(cls, code: int) -> EInteraction:
+        """\
+        Get the interaction from its code.
+
+        Parameters
+        ----------
+        code : int
+            The interaction code (i.e. "mc.iaction" * "stdhep.IdHEP").
+
+        Returns
+        -------
+        EInteraction
+            The interaction, or `EInteraction.UNKNOWN` for unknown codes.
+
+        Notes
+        -----
+        This is a single dictionary lookup (see `_from_value`), so it is faster
+        than calling `EInteraction(code)` in a loop.
+        """
+        return cls._from_value(code)
 
 
-class EPlaneView(_BaseEnum):
+class EPlaneView(_BaseIntEnum):
     # Note: I am using (mostly) the same Enum as the MINOS code (refer to
     #       `EPlaneView` on Doxygen).
 
@@ -251,4 +339,4 @@ class EPlaneView(_BaseEnum):
 
     @classmethod
     def _missing_(cls, value: object) -> EPlaneView:
-        return cls(cls.Unknown)
+        return cls.Unknown
@@ -12,9 +12,10 @@ from __future__ import annotations
 
 __all__ = ["DataHandler"]
 
-from typing import TypeVar, Generic
+from typing import Any, TypeVar, Generic
 
 import logging
+from functools import cache
 
 from ..logger import _error, _warn
 from .io_base import DataIOStrategy
@@ -31,8 +32,30 @@ _logger = logging.getLogger("Root")
 
 # Note: Not sure this is the best way to use the Plugin Architecture in Python.
 #       It seems to be working though...
+#
+#       The plugins (and their dependencies, e.g. Pandas and Uproot) are only
+#       imported when they are first needed.
+
+
+@cache
+def _get_plugins() -> dict[str, Any]:
+    """\
+    [ Internal ] Import the Data IO plugins (only once).
+
+    Returns
+    -------
+    dict[str, Any]
+        Dictionary of the Data IO plugins.
+    """
+    return import_plugins(file=__file__)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "plugins":
+        return _get_plugins()
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
-plugins = import_plugins(file=__file__)
 
 # ============================= [ Data Handler ] ============================= #
 
@@ -59,7 +82,7 @@ class DataHandler(Generic[T]):
 
     def __init__(
         self,
-        variables: list[str],
+        variables: list[str] | tuple[str, ...],
         data_io: str = "PandasIO",
         make_cut_bool_table: bool = False,
     ) -> None:
@@ -68,8 +91,8 @@ class DataHandler(Generic[T]):
 
         Parameters
         ----------
-        variables : list[str]
-            List of variables.
+        variables : list[str] | tuple[str, ...]
+            List of variables (e.g. `oscana.IMAGE_ALL_VARIABLES`).
         
         data_io : type[DataIOStrategyABC]
             Data IO strategy.
@@ -79,29 +102,47 @@ class DataHandler(Generic[T]):
         """
         # (1) Get the Data IO plugin.
 
-        data_io_plugin: type[DataIOStrategy[T]] | None = plugins.get(
+        data_io_plugin: type[DataIOStrategy[T]] | None = _get_plugins().get(
             data_io, None
         )
 
         if data_io_plugin is None:
             _error(
                 OscanaError,
-                (f"Data IO strategy '{data_io}' not found in the plugins."),
+                f"Data IO strategy '{data_io}' not found in the plugins.",
                 _logger,
             )
 
-        # (2) Initialise the instance variables.
+        # (2) Check for repeated variables.
 
-        self._data_io: DataIOStrategy[T] = data_io_plugin(parent=self)
+        # Note: The repeated variables would just overwrite each other when the
+        #       data is loaded, so they are dropped here (keeping the order).
+        if len(set(variables)) != len(variables):
+            _warn(
+                UserWarning,
+                "Repeated variables were found (and dropped) in `variables`.",
+                _logger,
+            )
+            variables = list(dict.fromkeys(variables))
+
+        # (3) Initialise the instance variables.
+
+        io: DataIOStrategy[T] = data_io_plugin(parent=self)
+
+        self._data_io = io
 
-        self._variables = variables
+        self._variables: list[str] = list(variables)
         self._has_cuts_table = bool(make_cut_bool_table)  # Just to be sure.
 
         self._t_metadata = TransformMetadata()
         self._f_metadata: list[FileMetadata] = []
 
-        self._data_table: T = self.io._init_data_table()
-        self._cuts_table: T = self.io._init_cuts_table()
+        self._data_table: T = io._init_data_table()
+
+        # Note: The cuts table is only created if it is going to be used.
+        self._cuts_table: T | None = (
+            io._init_cuts_table() if self._has_cuts_table else None
+        )
 
     def apply_transforms(self, transforms: list[TransformBase]) -> None:
         """\
@@ -113,9 +154,16 @@ class DataHandler(Generic[T]):
             List of transforms to apply.
         """
         n_errors: int = 0
+        n_transforms: int = len(transforms)
+
+        io = self._data_io
+        log_info = _logger.isEnabledFor(logging.INFO)
+
+        # Note: Only count the rows if they are going to be logged.
+        len_after = io.get_data_length() if log_info else 0
 
         for i, transform in enumerate(transforms):
-            len_before = self.io.get_data_length()
+            len_before = len_after
 
             try:
                 self._data_table, self._cuts_table = transform(dh=self)
@@ -132,11 +180,14 @@ class DataHandler(Generic[T]):
             else:
                 self._t_metadata._add_transform(transform=transform)
 
-            _logger.info(
-                f"({i + 1}/{len(transforms)}) Applied the transform "
-                f"`{transform}` to the data with {n_errors} errors. "
-                f"Number of Rows {len_before} -> {self.io.get_data_length()}."
-            )
+            if log_info:
+                len_after = io.get_data_length()
+
+                _logger.info(
+                    f"({i + 1}/{n_transforms}) Applied the transform "
+                    f"`{transform}` to the data with {n_errors} errors. "
+                    f"Number of Rows {len_before} -> {len_after}."
+                )
 
         if n_errors > 0:
             _error(
@@ -146,6 +197,45 @@ class DataHandler(Generic[T]):
                 _logger,
             )
 
+    def copy(self) -> DataHandler[T]:
+        """\
+        Copy the data handler.
+
+        Returns
+        -------
+        DataHandler[T]
+            A new data handler with the same data, transforms and files.
+
+        Notes
+        -----
+        The tables are copied by the Data IO strategy, which does not need to
+        copy the underlying data (e.g. see `PandasIO._copy_table`).
+        """
+        # Note: `__init__` is skipped here, so that the (empty) tables are not
+        #       created just to be replaced.
+        dh: DataHandler[T] = DataHandler.__new__(DataHandler)
+
+        io = self._data_io.__class__(parent=dh)
+        io._cache = set(self._data_io._cache)
+
+        dh._data_io = io
+
+        dh._variables = list(self._variables)
+        dh._has_cuts_table = self._has_cuts_table
+
+        dh._t_metadata = TransformMetadata(
+            transforms=list(self._t_metadata.transforms)
+        )
+        dh._f_metadata = list(self._f_metadata)
+
+        dh._data_table = io._copy_table(self._data_table)
+        dh._cuts_table = None
+
+        if self._cuts_table is not None:
+            dh._cuts_table = io._copy_table(self._cuts_table)
+
+        return dh
+
     def print_handler_info(self) -> None:
         """\
         Print handler information.
@@ -182,6 +272,8 @@ class DataHandler(Generic[T]):
         """\
         Print available plugins.
         """
+        plugins = _get_plugins()
+
         print("Available Data IO Plugins")
         print("-------------------------")
         for plugin_name in plugins.keys():
@@ -12,14 +12,13 @@ from __future__ import annotations
 
 __all__ = []
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-# Note: There is a compatibility issue with `dataclasses`--in older versions of
-#       Python, the `slots` parameter is not available. I will solve this issue
-#       if it arises.
+# Note: The `slots` parameter of `dataclasses` needs Python 3.10+, which is the
+#       minimum Python version supported by Oscana.
 
 import logging, re
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 
 import numpy as np
@@ -40,7 +39,10 @@ from .enumerations import (
 )
 from ..logger import _error
 from ..utils import OscanaError, _convert_from_utc
-from ..constants import SNTP_BR_STD, SNTP_VR_RUN, SNTP_VR_EVT_UTC
+from ..constants import SNTP_BR_STD, SNTP_VR_EVT_UTC
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # =============================== [ Logging  ] =============================== #
@@ -49,37 +51,19 @@ logger = logging.getLogger("Root")
 
 # ============================== [ Constants  ] ============================== #
 
-_sumamry_text = """\
-{0!s}
-{1!s}
-File Format     : {2!s}
-File Type       : {3!s}
-Experiment      : {4!s}
-Detector        : {5!s}
-Int. Region     : {6!s}
-Flavour         : {7!s}
-Mag. Field      : {8!s}
-Horn Position   : {9!s}
-Target Z Shift  : {10!s} cm
-Curr. Direction : {11!s}
-Current         : {12!s} kAmps
-Run Number      : {13:,}
-MC Version      : {14!s} {15!s}
-Reco. Version   : {16!s} {17!s}
-Date and Time
-    Start       : {18!s}
-    End         : {19!s}
-Total Entries   : {20:,}
-First Loaded On : {21!s}
-"""
+_daikon_detector_map: dict[str, EDetector] = {
+    "n1": EDetector.NEAR,
+    "f2": EDetector.FAR,
+    "F2": EDetector.FAR,
+}
 
-_daikon_key_map: dict[str, tuple[EDetector, EFileType]] = {
-    "n1": (EDetector.NEAR, EFileType.MONTE_CARLO),
-    "f2": (EDetector.FAR, EFileType.MONTE_CARLO),
-    "F2": (EDetector.FAR, EFileType.UNKNOWN),  # Mock Data?
+_daikon_file_type_map: dict[str, EFileType] = {
+    "n1": EFileType.MONTE_CARLO,
+    "f2": EFileType.MONTE_CARLO,
+    "F2": EFileType.UNKNOWN,  # Mock Data?
 }
 
-_daikon_regex = (
+_daikon_regex = re.compile(
     r"^(?P<det>n1|f2|F2)"  # Detector
     r"(?P<int>[012345])"  # Interaction
     r"(?P<flr>[012349])"  # Flavour
@@ -101,33 +85,6 @@ _daikon_regex = (
 # =========================== [ Helper Functions ] =========================== #
 
 
-def _get_sntp_run_number(file_name: str, ntpst_branch: Any) -> int:
-    """\
-    [ Internal ]
-
-    Get the run number from the file.
-
-    Notes
-    -----
-    Called by `_get_sntp_metadata`.
-    """
-    run_numbers = ntpst_branch[SNTP_VR_RUN].arrays(library="np")[
-        SNTP_VR_RUN.split("/")[-1]
-    ]
-
-    if np.all(run_numbers == run_numbers[0]):
-        return run_numbers[0]
-
-    logger.warning(f"Multiple run numbers found in the file '{file_name}'!")
-
-    # Note: Here I am finding the mode of the run number just in case the file
-    #       has more than one run stored in it (which is unlikely).
-    values, counts = np.unique(run_numbers, return_counts=True)
-    run_number = values[np.argmax(counts)]
-
-    return run_number
-
-
 def _get_sntp_datetime_and_len(
     ntpst_branch: Any,
 ) -> tuple[datetime, datetime, int]:
@@ -140,22 +97,25 @@ def _get_sntp_datetime_and_len(
     -----
     Called by `_get_sntp_metadata`.
     """
-    time_array = _convert_from_utc(
-        utc_timestamps=ntpst_branch[SNTP_VR_EVT_UTC].arrays(library="np")[
-            SNTP_VR_EVT_UTC.split("/")[-1]
-        ]
-    )
+    # Note: Reading the branch with `array` (not `arrays`) gives the array
+    #       directly, so there is no need to look up the leaf name.
+    utc_timestamps = ntpst_branch[SNTP_VR_EVT_UTC].array(library="np")
 
-    # Note: A simple `type` will tell you that np.min(...) and np.max(...)
-    #       return a `datetime.datetime` object not a NumPy `datetime64` object!
-    #       So I have decided to ignore the `reportReturnType` warning here.
+    # Note: The conversion from UTC is monotonic, so we can find the min and
+    #       max of the raw timestamps and only convert those two values.
     #
-    #       Weird "typing" going on here...
+    #       Also, a simple `type` will tell you that the converted values are
+    #       `datetime.datetime` objects not NumPy `datetime64` objects! So I
+    #       have decided to ignore the `reportReturnType` warning here.
+
+    start_time, end_time = _convert_from_utc(
+        utc_timestamps=np.array([utc_timestamps.min(), utc_timestamps.max()])
+    )
 
     return (  # pyright: ignore[reportReturnType]
-        np.min(time_array),
-        np.max(time_array),
-        len(time_array),
+        start_time,
+        end_time,
+        len(utc_timestamps),
     )
 
 
@@ -173,34 +133,34 @@ def _parse_file_name_spill_daikon(file_name: str) -> dict[str, Any] | None:
     Returns
     -------
     None | dict[str, Any]"""
-    result = re.match(_daikon_regex, file_name)
-    file_format = EFileFormat(file_name.split(".")[-1])
+    result = _daikon_regex.match(file_name)
+    file_format = EFileFormat._from_value(file_name.split(".")[-1])
 
     if (result is None) or (file_format == EFileFormat.UNKNOWN):
         return
 
-    detector, file_type = _daikon_key_map[result.group("det")]
+    detector_key = result.group("det")
 
     return {
         "file_name": file_name,
         "file_format": file_format,
-        "file_type": file_type,
+        "file_type": _daikon_file_type_map[detector_key],
         "experiment": EExperiment.MINOS,
-        "detector": detector,
-        "interaction": EDaikonIntRegion(int(result.group("int"))),
-        "flavour": EDaikonFlavour(int(result.group("flr"))),
-        "mag_field": EDaikonMagField(int(result.group("fld"))),
-        "horn_pos": EHornPosition(result.group("pos")),
+        "detector": _daikon_detector_map[detector_key],
+        "interaction": EDaikonIntRegion._from_value(int(result.group("int"))),
+        "flavour": EDaikonFlavour._from_value(int(result.group("flr"))),
+        "mag_field": EDaikonMagField._from_value(int(result.group("fld"))),
+        "horn_pos": EHornPosition._from_value(result.group("pos")),
         "tgt_z_shift": int(result.group("zst")),
-        "current_sign": EHornCurrent(result.group("sgn")),
+        "current_sign": EHornCurrent._from_value(result.group("sgn")),
         "current": int(result.group("cur")),
         "run_number": int(result.group("bfr")),
         "mc_version": (
-            EMCVersion(result.group("veg")),
+            EMCVersion._from_value(result.group("veg")),
             int(result.group("ver")),
         ),
         "reco_version": (
-            ERecoVersion(result.group("wod")),
+            ERecoVersion._from_value(result.group("wod")),
             float(result.group("wer")),
         ),
     }
@@ -336,7 +296,45 @@ class FileMetadata:
     end_time: datetime
     n_records: int
 
-    create_time: datetime = datetime.now()
+    create_time: datetime = field(default_factory=datetime.now)
+
+    # Note: This is the tuple of fields which are compared in `__eq__`. It is
+    #       only created once (the dataclass is frozen), so comparing metadata
+    #       is a single tuple comparison.
+    _key: tuple[Any, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_key",
+            (
+                self.file_type,
+                self.experiment,
+                self.detector,
+                self.interaction,
+                self.flavour,
+                self.mag_field,
+                self.horn_pos,
+                self.tgt_z_shift,
+                self.current_sign,
+                self.current,
+                self.run_number,
+                self.mc_version,
+                self.reco_version,
+            ),
+        )
+
+    # Note: Only the `__init__` fields are pickled (as a tuple), and `_key` is
+    #       re-created by `__init__` when unpickling, so the pickled metadata is
+    #       smaller. This uses `__reduce__` (and not `__getstate__` and
+    #       `__setstate__`), because the dataclass decorator replaces those for
+    #       frozen dataclasses with slots on Python 3.10.
+
+    def __reduce__(self) -> tuple[type[FileMetadata], tuple[Any, ...]]:
+        return (
+            FileMetadata,
+            tuple(getattr(self, name) for name in _f_metadata_init_fields),
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """\
@@ -369,6 +367,80 @@ class FileMetadata:
             "create_time": self.create_time.isoformat(),
         }
 
+    @staticmethod
+    def to_table(f_metadata: list[FileMetadata]) -> pd.DataFrame:
+        """\
+        Convert a list of metadata to a table (with one row per file).
+
+        Parameters
+        ----------
+        f_metadata: list[FileMetadata]
+            List of metadata.
+
+        Returns
+        -------
+        pd.DataFrame
+            Table of the metadata.
+
+        Notes
+        -----
+        The Enum fields are stored as categorical columns of their values (not
+        as columns of Enum objects), so they only take up a small integer code
+        per row and can be grouped/filtered quickly.
+        """
+        # Note: Pandas is imported here so that importing this module stays
+        #       cheap.
+        import pandas as pd
+
+        enum_columns = {
+            "file_format": EFileFormat,
+            "file_type": EFileType,
+            "experiment": EExperiment,
+            "detector": EDetector,
+            "interaction": EDaikonIntRegion,
+            "flavour": EDaikonFlavour,
+            "mag_field": EDaikonMagField,
+            "horn_pos": EHornPosition,
+            "current_sign": EHornCurrent,
+            "mc_version": EMCVersion,
+            "reco_version": ERecoVersion,
+        }
+
+        table = pd.DataFrame(
+            {
+                "file_name": [fm.file_name for fm in f_metadata],
+                "file_format": [fm.file_format.value for fm in f_metadata],
+                "file_type": [fm.file_type.value for fm in f_metadata],
+                "experiment": [fm.experiment.value for fm in f_metadata],
+                "detector": [fm.detector.value for fm in f_metadata],
+                "interaction": [fm.interaction.value for fm in f_metadata],
+                "flavour": [fm.flavour.value for fm in f_metadata],
+                "mag_field": [fm.mag_field.value for fm in f_metadata],
+                "horn_pos": [fm.horn_pos.value for fm in f_metadata],
+                "tgt_z_shift": [fm.tgt_z_shift for fm in f_metadata],
+                "current_sign": [fm.current_sign.value for fm in f_metadata],
+                "current": [fm.current for fm in f_metadata],
+                "run_number": [fm.run_number for fm in f_metadata],
+                "mc_version": [fm.mc_version[0].value for fm in f_metadata],
+                "mc_version_number": [fm.mc_version[1] for fm in f_metadata],
+                "reco_version": [fm.reco_version[0].value for fm in f_metadata],
+                "reco_version_number": [
+                    fm.reco_version[1] for fm in f_metadata
+                ],
+                "start_time": [fm.start_time for fm in f_metadata],
+                "end_time": [fm.end_time for fm in f_metadata],
+                "n_records": [fm.n_records for fm in f_metadata],
+                "create_time": [fm.create_time for fm in f_metadata],
+            }
+        )
+
+        return table.astype(
+            {
+                column: pd.CategoricalDtype([member.value for member in enum])
+                for column, enum in enum_columns.items()
+            }
+        )
+
     @staticmethod
     def from_dict(dict: dict[str, Any]) -> FileMetadata:
         """\
@@ -446,31 +518,31 @@ class FileMetadata:
         """\
         Print the metadata of the file in a human-readable format.
         """
+        # Note: This is an f-string (rather than a template string which is
+        #       formatted), so it is parsed once when the module is compiled.
         print(
-            _sumamry_text.format(
-                self.file_name,
-                "-" * len(self.file_name),
-                self.file_format,
-                self.file_type,
-                self.experiment,
-                self.detector,
-                self.interaction,
-                self.flavour,
-                self.mag_field,
-                self.horn_pos,
-                self.tgt_z_shift,
-                self.current_sign,
-                self.current,
-                self.run_number,
-                self.mc_version[0],
-                self.mc_version[1],
-                self.reco_version[0],
-                self.reco_version[1],
-                self.start_time,
-                self.end_time,
-                self.n_records,
-                str(self.create_time)[:19],
-            )
+            f"{self.file_name!s}\n"
+            f"{'-' * len(self.file_name)}\n"
+            f"File Format     : {self.file_format!s}\n"
+            f"File Type       : {self.file_type!s}\n"
+            f"Experiment      : {self.experiment!s}\n"
+            f"Detector        : {self.detector!s}\n"
+            f"Int. Region     : {self.interaction!s}\n"
+            f"Flavour         : {self.flavour!s}\n"
+            f"Mag. Field      : {self.mag_field!s}\n"
+            f"Horn Position   : {self.horn_pos!s}\n"
+            f"Target Z Shift  : {self.tgt_z_shift!s} cm\n"
+            f"Curr. Direction : {self.current_sign!s}\n"
+            f"Current         : {self.current!s} kAmps\n"
+            f"Run Number      : {self.run_number:,}\n"
+            f"MC Version      : {self.mc_version[0]!s} {self.mc_version[1]!s}\n"
+            f"Reco. Version   : {self.reco_version[0]!s} "
+            f"{self.reco_version[1]!s}\n"
+            f"Date and Time\n"
+            f"    Start       : {self.start_time!s}\n"
+            f"    End         : {self.end_time!s}\n"
+            f"Total Entries   : {self.n_records:,}\n"
+            f"First Loaded On : {str(self.create_time)[:19]}\n"
         )
 
     def __eq__(self, value: object) -> bool:
@@ -484,23 +556,10 @@ class FileMetadata:
                 logger,
             )
 
-        return (
-            (self.file_type == value.file_type)
-            and (self.experiment == value.experiment)
-            and (self.detector == value.detector)
-            and (self.interaction == value.interaction)
-            and (self.flavour == value.flavour)
-            and (self.mag_field == value.mag_field)
-            and (self.horn_pos == value.horn_pos)
-            and (self.tgt_z_shift == value.tgt_z_shift)
-            and (self.current_sign == value.current_sign)
-            and (self.current == value.current)
-            and (self.run_number == value.run_number)
-            and (self.mc_version[0] == value.mc_version[0])
-            and (self.mc_version[1] == value.mc_version[1])
-            and (self.reco_version[0] == value.reco_version[0])
-            and (self.reco_version[1] == value.reco_version[1])
-        )
+        return self._key == value._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
 
     def __ne__(self, value: object) -> bool:
         return not self.__eq__(value)
@@ -510,3 +569,8 @@ class FileMetadata:
 
     def __repr__(self) -> str:
         return str(self)
+
+
+_f_metadata_init_fields: tuple[str, ...] = tuple(
+    f.name for f in fields(FileMetadata) if f.init
+)
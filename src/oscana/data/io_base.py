@@ -12,7 +12,15 @@ from __future__ import annotations
 
 __all__ = []
 
-from typing import TYPE_CHECKING, TypeAlias, TypeVar, Protocol, Generic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    TypeAlias,
+    TypeVar,
+    Protocol,
+    Generic,
+)
 
 import logging
 from pathlib import Path
@@ -31,6 +39,9 @@ if TYPE_CHECKING:
 TCov = TypeVar("TCov", covariant=True)
 TCon = TypeVar("TCon", contravariant=True)
 
+# Generic type for the "loader" / "writer" functions.
+TFunc = TypeVar("TFunc", bound=Callable[..., Any])
+
 
 class LoaderFuncType(Protocol, Generic[TCov]):
     """\
@@ -79,7 +90,7 @@ _logger = logging.getLogger("Root")
 # =========================== [ Helper Functions ] =========================== #
 
 
-def _get_non_cache_files(cache: list[str], files: list[str]) -> list[str]:
+def _get_non_cache_files(cache: set[str], files: list[str]) -> list[str]:
     """\
     [ Internal ]
 
@@ -87,8 +98,8 @@ def _get_non_cache_files(cache: list[str], files: list[str]) -> list[str]:
 
     Parameters
     ----------
-    cache : list[str]
-        List of files that are already in the cache.
+    cache : set[str]
+        Set of files that are already in the cache.
 
     files : list[str]
         List of files to check against the cache.
@@ -96,7 +107,7 @@ def _get_non_cache_files(cache: list[str], files: list[str]) -> list[str]:
     Returns
     -------
     list[str]
-        List of files that are not in the cache.
+        List of files that are not in the cache (in the same order).
     """
     non_cache_files = []
 
@@ -105,27 +116,89 @@ def _get_non_cache_files(cache: list[str], files: list[str]) -> list[str]:
             _logger.info(f"Skipping '{file}' as it is already in the cache.")
             continue
 
+        # Note: The file is added straight away, so repeats in `files` are also
+        #       skipped.
+        cache.add(file)
         non_cache_files.append(file)
 
-    cache.extend(non_cache_files)
-
     return non_cache_files
 
 
+def _io_func(name: str) -> Callable[[TFunc], TFunc]:
+    """\
+    [ Internal ]
+
+    Decorator to give a "loader" / "writer" function its name (which is shown
+    in the IO strategy information).
+
+    Parameters
+    ----------
+    name : str
+        The name of the "loader" / "writer" (e.g. "Naïve Loader V1").
+
+    Returns
+    -------
+    Callable[[TFunc], TFunc]
+        The decorator, which sets the `_io_name` attribute of the function.
+    """
+
+    def decorator(func: TFunc) -> TFunc:
+        func._io_name = name  # type: ignore[attr-defined]
+        return func
+
+    return decorator
+
+
+def _get_func_name(func: Any) -> str:
+    """\
+    [ Internal ]
+
+    Get the name of a "loader" / "writer".
+
+    Parameters
+    ----------
+    func : Any
+        The "loader" or "writer" function.
+
+    Returns
+    -------
+    str
+        The name (i.e. set with the `_io_func` decorator), or "???" if the
+        function does not have a name.
+    """
+    return getattr(func, "_io_name", "???")
+
+
 # =========================== [ Data IO Strategy ] =========================== #
 
 
 class DataIOStrategy(ABC, Generic[TCov]):  # Can't use the cool 3.12 syntax :(
 
+    __slots__ = ["_parent", "_cache"]
+
     _sntp_loader: LoaderFuncType[TCov]
     _udst_loader: LoaderFuncType[TCov]
     _hdf5_loader: LoaderFuncType[TCov]
 
     _hdf5_writer: WriterFuncType[TCov]
 
+    _strategy_info: dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # Note: The names of the "loaders" and "writers" are only looked up
+        #       once (when the strategy class is created).
+        cls._strategy_info = {
+            "SNTP Loader": _get_func_name(getattr(cls, "_sntp_loader", None)),
+            "uDST Loader": _get_func_name(getattr(cls, "_udst_loader", None)),
+            "HDF5 Loader": _get_func_name(getattr(cls, "_hdf5_loader", None)),
+            "HDF5 Writer": _get_func_name(getattr(cls, "_hdf5_writer", None)),
+        }
+
     def __init__(self, parent: DataHandler) -> None:
         self._parent: DataHandler = parent
-        self._cache: list[str] = []
+        self._cache: set[str] = set()
 
     @abstractmethod
     def _init_data_table(self) -> TCov:
@@ -210,14 +283,7 @@ class DataIOStrategy(ABC, Generic[TCov]):  # Can't use the cool 3.12 syntax :(
         dict[str, str]
             Dictionary containing the IO strategy information.
         """
-        doc = lambda x: x.__doc__.split("\n")[2][4:] if x.__doc__ else "???"
-        get = lambda x: doc(x)[6:] if doc(x).startswith("Name: ") else "???"
-        return {
-            "SNTP Loader": get(self._sntp_loader),
-            "uDST Loader": get(self._udst_loader),
-            "HDF5 Loader": get(self._hdf5_loader),
-            "HDF5 Writer": get(self._hdf5_writer),
-        }
+        return dict(self._strategy_info)
 
     def from_sntp(self, files: list[str]) -> None:
         """\
@@ -282,6 +348,26 @@ class DataIOStrategy(ABC, Generic[TCov]):  # Can't use the cool 3.12 syntax :(
 
         return self._from_hdf5(files=files)
 
+    def _copy_table(self, table: TCov) -> TCov:
+        """\
+        [ Internal ] Copy a data / cuts table (used by `DataHandler.copy`).
+
+        Parameters
+        ----------
+        table : DataFrame
+            The table to copy.
+
+        Returns
+        -------
+        DataFrame
+            The copied table.
+        """
+        _error(
+            NotImplementedError,
+            f"Copying tables is not implemented for {self.__class__.__name__}!",
+            _logger,
+        )
+
     def to_hdf5(self, file: str | Path) -> None:
         _error(
             NotImplementedError,
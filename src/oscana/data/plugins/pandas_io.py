@@ -14,16 +14,22 @@ __all__ = ["PandasIO"]  # Only export the class (any other stuff is ignored)!
 
 from typing import TYPE_CHECKING
 
+import os
 import logging
 from pathlib import Path
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import numpy.typing as npt
 import uproot
 import pandas as pd
 import h5py
 
 from ...logger import _error
+from ...constants import SNTP_VARIABLE_DTYPES
 from ..io_base import (
+    _io_func,
     DataIOStrategy,
     LoaderFuncType,
     WriterFuncType,
@@ -48,115 +54,262 @@ _logger = logging.getLogger("Root")
 # =============================== [ Helpers  ] =============================== #
 
 
+def _group_variables_by_base(variables: list[str]) -> dict[str, list[str]]:
+    """\
+    [ Internal ]
+
+    Group the variables by their base (i.e. the TTree), so that all the
+    variables in the same TTree can be read in a single pass.
+
+    Parameters
+    ----------
+    variables : list[str]
+        List of variables (i.e. "base/key").
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Dictionary of the keys for each base (in the same order).
+    """
+    # TODO: Fix this (not great that we need to specify a base in this way).
+    keys_by_base: dict[str, list[str]] = {}
+
+    for variable in variables:
+        base, _, key = variable.partition("/")
+        keys_by_base.setdefault(base, []).append(key)
+
+    return keys_by_base
+
+
+def _cast_to_dtype_hint(array: npt.NDArray, variable: str) -> npt.NDArray:
+    """\
+    [ Internal ]
+
+    Cast the array of a variable to its dtype in `SNTP_VARIABLE_DTYPES`.
+
+    Parameters
+    ----------
+    array : npt.NDArray
+        The array of the variable (flat or jagged, i.e. an array of arrays).
+
+    variable : str
+        The name of the variable (i.e. "base/key").
+
+    Returns
+    -------
+    npt.NDArray
+        The cast array, or the same array if the variable is not listed.
+    """
+    dtype = SNTP_VARIABLE_DTYPES.get(variable)
+
+    if dtype is None:
+        return array
+
+    if array.dtype != object:
+        return array.astype(dtype, copy=False)
+
+    # Note: Jagged branches are read as an array of arrays (one per record).
+    for i, record in enumerate(array):
+        array[i] = record.astype(dtype, copy=False)
+
+    return array
+
+
 def _v1_naive_loader(
-    variables: list[str], file: str
+    keys_by_base: dict[str, list[str]],
+    file: str,
+    decompression_executor: ThreadPoolExecutor | None = None,
 ) -> tuple[pd.DataFrame, FileMetadata]:
     _logger.debug(f"Loading variables from '{file}' using the V1 Naive Loader.")
 
     file_dir = _get_dir_from_env(file=file)
 
-    uproot_file = uproot.open(file_dir)
+    data_dict: dict[str, npt.NDArray] = {}
 
-    _logger.info(f"Opened '{file}' using Uproot.")
+    # Note: Using `with` makes sure that the file is closed even if one of the
+    #       variables is not found (or anything else goes wrong).
+    #
+    #       Each variable is only read once, so Uproot's array cache is turned
+    #       off (it would just keep another reference to every array until the
+    #       file is closed). The object cache is kept, because the TTrees are
+    #       looked up more than once (e.g. for the metadata).
 
-    # This is a really crappy way to extract the metadata...
-    metadata = FileMetadata.from_sntp(
-        file_name=Path(file_dir).name, file=uproot_file
-    )
+    with uproot.open(file_dir, array_cache=None) as uproot_file:
+        _logger.info(f"Opened '{file}' using Uproot.")
 
-    data_dict: dict[str, npt.NDArray] = {}
+        # This is a really crappy way to extract the metadata...
+        metadata = FileMetadata.from_sntp(
+            file_name=Path(file_dir).name, file=uproot_file
+        )
 
-    for variable in variables:
-        _logger.debug(f"Extracting variable '{variable}' from '{file}'...")
+        for base, keys in keys_by_base.items():
+            _logger.debug(f"Extracting variables {keys} from '{file}'...")
+
+            # Note: I have added some `pyright` comments to suppress annoying
+            #       warnings.
+
+            try:
+                base_branch = uproot_file[base]
+            except uproot.KeyInFileError:
+                _error(
+                    OscanaError,
+                    f"Base '{base}' not found in '{file}'!",
+                    _logger,
+                )
+
+            # Note: Uproot silently skips names which are not in the TTree when
+            #       reading them together, so all the variables are checked
+            #       first (and all the missing ones are reported at once).
+            missing_keys = [
+                key for key in keys if key not in base_branch  # pyright: ignore
+            ]
+
+            if missing_keys:
+                _error(
+                    OscanaError,
+                    f"Variables {missing_keys} not found in '{file}'!",
+                    _logger,
+                )
+
+            arrays = base_branch.arrays(  # pyright: ignore
+                keys,
+                library="np",
+                decompression_executor=decompression_executor,
+            )
 
-        # Note: Not great that we need to specify a base in this way.
+            # Note: Uproot returns the arrays in the order of the TTree.
+            for key in keys:
+                data_dict[key] = _cast_to_dtype_hint(
+                    array=arrays[key], variable=f"{base}/{key}"
+                )
 
-        # TODO: Fix this.
-        base = variable.split("/")[0]
-        key = "/".join(variable.split("/")[1:])
+    _logger.info(f"Extracted variables from '{file}'.")
 
-        # Note: I have added some `pyright` comments to suppress annoying
-        #       warnings.
+    # Note: The arrays are freshly read (and not used anywhere else), so the
+    #       DataFrame can use them directly instead of copying every column.
+    return pd.DataFrame(data_dict, copy=False), metadata
 
-        try:
-            base_branch = uproot_file[base]
-        except uproot.KeyInFileError:
-            _error(
-                OscanaError,
-                f"Base '{base}' not found in '{file}'!",
-                _logger,
-            )
 
-        try:
-            data_dict[key] = base_branch[
-                key
-            ].arrays(  # pyright: ignore[reportAttributeAccessIssue]
-                library="np"
-            )[
-                key.split("/")[-1]
-            ]
-        except uproot.KeyInFileError:
-            _error(
-                OscanaError,
-                f"Variable '{key}' not found in '{file}'!",
-                _logger,
-            )
+def _is_copy_on_write() -> bool:
+    """\
+    [ Internal ]
 
-    uproot_file.close()  # pyright: ignore[reportAttributeAccessIssue]
+    Check if Pandas' Copy-on-Write is active.
 
-    _logger.info(f"Extracted variables from '{file}'.")
+    Returns
+    -------
+    bool
+        Whether Copy-on-Write is active (always the case since Pandas 3.0).
+    """
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
 
-    return pd.DataFrame(data_dict), metadata
+    return pd.get_option("mode.copy_on_write") is True
 
 
 # =========================== [ Dynamic Helpers  ] =========================== #
 
 
+@_io_func(name="Naïve Loader V1")
 def hlp_20250205_from_sntp(
     variables: list[str], files: list[str]
 ) -> LoadedDataType[pd.DataFrame]:
     """\
     [ Internal ]
-    
-    Name: Naïve Loader V1
+
+    Load the variables from SNTP ROOT files (one file per thread).
     """
-    exceptions_ = []
+    exceptions_: list[OscanaError] = []
     data_list: list[pd.DataFrame] = []
     f_metadata_list: list[FileMetadata] = []
 
-    for file in files:
-        try:
-            data, f_meta = _v1_naive_loader(variables, file)
-
-            if len(f_metadata_list):
-                if f_meta != f_metadata_list[-1]:
-                    _error(
-                        OscanaError,
-                        "All files must have the same metadata!",
-                        _logger,
-                    )
-
-            data_list.append(data)
-            f_metadata_list.append(f_meta)
-        except Exception as e:
-            exceptions_.append(e)
-
-    if len(exceptions_):
-        for e in exceptions_:
-            if e.__class__.__name__ == "OscanaError":
-                continue
+    # Note: The variables are only split into their bases and keys once (not
+    #       once per file).
+    keys_by_base = _group_variables_by_base(variables)
+
+    # Note: Loading a file is mostly I/O and decompression (where Uproot and
+    #       NumPy release the GIL), so the files are loaded in parallel threads.
+    #       The results are still checked in the same order as the files.
+    #
+    #       When there are fewer files than CPUs, the spare CPUs are used to
+    #       decompress the baskets of each file in parallel (which Uproot does
+    #       one at a time by default).
+
+    n_cpus = os.cpu_count() or 1
+    max_workers = max(1, min(len(files), n_cpus))
+    n_spare_cpus = n_cpus - max_workers
+
+    # Note: The decompression pool is only created if there are spare CPUs
+    #       (`nullcontext` gives `None`, i.e. Uproot's default).
+    decomp_context = (
+        ThreadPoolExecutor(max_workers=n_spare_cpus)
+        if n_spare_cpus > 0
+        else nullcontext()
+    )
 
-            _logger.error(
-                f"An execption was supressed! {e.__class__.__name__} - {e!s}"
-                + ("." if str(e)[-1] != "." or str(e)[-1] != "!" else "")
+    with (
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+        decomp_context as decomp_executor,
+    ):
+        futures = [
+            executor.submit(
+                _v1_naive_loader,
+                keys_by_base,
+                file,
+                decomp_executor,
             )
+            for file in files
+        ]
+
+        for future in futures:
+            try:
+                data, f_meta = future.result()
+
+                if len(f_metadata_list):
+                    if f_meta != f_metadata_list[-1]:
+                        _error(
+                            OscanaError,
+                            "All files must have the same metadata!",
+                            _logger,
+                        )
+
+                data_list.append(data)
+                f_metadata_list.append(f_meta)
+            except OscanaError as e:
+                # Note: These are already logged (by `_error`), and are all
+                #       reported together once every file has been checked.
+                exceptions_.append(e)
+            except Exception as e:
+                # Note: Anything else is unexpected, so there is no point in
+                #       loading the rest of the files.
+                for pending_future in futures:
+                    pending_future.cancel()
+
+                message = str(e)
+
+                if not message.endswith((".", "!")):
+                    message += "."
+
+                _logger.error(
+                    f"Failed to load the files! {e.__class__.__name__} - "
+                    + message
+                )
+                raise
+
+    if len(exceptions_):
         _error(
             OscanaError,
             "One or more files failed to load! (See the above exceptions.)",
             _logger,
         )
 
-    return (pd.concat(data_list), f_metadata_list, None)
+    # Note: Each of the loaded frames already has a default (range) index, so
+    #       a single file does not need to be concatenated.
+
+    if len(data_list) == 1:
+        return (data_list[0], f_metadata_list, None)
+
+    return (pd.concat(data_list, ignore_index=True), f_metadata_list, None)
 
 
 def hlp_20250205_from_udst(
@@ -174,21 +327,78 @@ def hlp_20250205_from_udst(
     )
 
 
+@_io_func(name="HDF5 Loader V1")
 def hlp_20250205_from_hdf5(
     variables: list[str], files: list[str | Path]
 ) -> LoadedDataType[pd.DataFrame]:
     """\
     [ Internal ]
 
-    Not Implemented!
+    Load the variables from HDF5 files (written by the HDF5 writer).
     """
-    _error(
-        NotImplementedError,
-        "The HDF5 loader is not implemented yet!",
-        _logger,
-    )
+    # Note: The HDF5 writer stores the columns (i.e. the keys, without their
+    #       base) as the fields of a single "table" dataset.
+    keys = [
+        key
+        for base_keys in _group_variables_by_base(variables).values()
+        for key in base_keys
+    ]
+
+    data_list: list[pd.DataFrame] = []
+
+    for file in files:
+        file_dir = _get_dir_from_env(file=str(file))
+
+        _logger.debug(f"Loading variables from '{file}' using the HDF5 Loader.")
+
+        # Note: The chunk cache is made big enough to hold a whole chunk (the
+        #       writer uses chunks of ~1 MiB), so each chunk is only read and
+        #       decompressed once.
+
+        with h5py.File(file_dir, "r", rdcc_nbytes=64 << 20) as my_file:
+            if "table" not in my_file:
+                _error(
+                    OscanaError,
+                    f"No data table found in '{file}'!",
+                    _logger,
+                )
+
+            table_dataset = my_file["table"]
+            table_fields = table_dataset.dtype.fields or {}
+
+            missing_keys = [key for key in keys if key not in table_fields]
+
+            if missing_keys:
+                _error(
+                    OscanaError,
+                    f"Variables {missing_keys} not found in '{file}'!",
+                    _logger,
+                )
+
+            # Note: Only the requested fields are read, straight into a
+            #       preallocated buffer (HDF5 picks out the fields by name, so
+            #       there is no intermediate copy of the whole table).
+            table = np.empty(
+                table_dataset.shape,
+                dtype=[(key, table_fields[key][0]) for key in keys],
+            )
+
+            if len(table):
+                table_dataset.read_direct(table)
+
+        _logger.info(f"Extracted variables from '{file}'.")
+
+        data_list.append(pd.DataFrame(table))
 
+    # Note: The HDF5 files do not store any file metadata (yet).
 
+    if len(data_list) == 1:
+        return (data_list[0], [], None)
+
+    return (pd.concat(data_list, ignore_index=True), [], None)
+
+
+@_io_func(name="HDF5 Writer V1")
 def hlp_20250205_to_hdf5(
     data: pd.DataFrame,
     file_metadata: FileMetadata,
@@ -198,28 +408,69 @@ def hlp_20250205_to_hdf5(
     """\
     [ Internal ]
 
-    Name: HDF5 Writer V1
+    Write the data table to an HDF5 file (as a single "table" dataset).
     """
+    # Note: All the columns are packed into a single dataset (with a compound
+    #       dtype, one field per column), so each file only has one dataset and
+    #       one chunk index, rather than one per column. The field names can
+    #       also have "/" in them (e.g. the keys of the nested branches in
+    #       "NtpStRecord"), which would otherwise be read as groups by h5py.
+
+    # Note: The table is written in chunks of (at most) ~1 MiB, with the byte
+    #       shuffle filter and a low gzip level. This is much faster to write
+    #       than gzip level 9, for only slightly bigger files (the shuffle does
+    #       most of the work for numerical data). Only the filters that come
+    #       with h5py are used, so the files can be read anywhere without
+    #       third-party plugins (e.g. `hdf5plugin`).
+
     columns = data.columns.tolist()
 
-    my_file = h5py.File(file, "w")
+    # Note: Only fixed-size NumPy dtypes can be packed into the table, so jagged
+    #       (object) and extension (e.g. string) columns are not supported.
+    unsupported_columns = [
+        column
+        for column in columns
+        if not isinstance(data[column].dtype, np.dtype)
+        or data[column].dtype.hasobject
+    ]
 
-    for column in columns:
-        my_file.create_dataset(
-            column,
-            data=data[column].to_numpy(),
-            compression="gzip",
-            compression_opts=9,
+    if unsupported_columns:
+        _error(
+            OscanaError,
+            (
+                f"Columns {unsupported_columns} cannot be written to HDF5 "
+                "(only columns with a fixed-size NumPy dtype are supported)!"
+            ),
+            _logger,
         )
 
-    my_file.close()
-
-    _error(
-        NotImplementedError,
-        "The HDF5 writer is not implemented yet!",
-        _logger,
+    table = np.empty(
+        len(data),
+        dtype=[(str(column), data[column].dtype) for column in columns],
     )
 
+    for column in columns:
+        table[str(column)] = data[column].to_numpy()
+
+    with h5py.File(file, "w") as my_file:
+        if not len(table):
+            # Note: Empty datasets cannot be chunked (or compressed).
+            my_file.create_dataset("table", data=table)
+        else:
+            chunk_len = (1 << 20) // max(1, table.dtype.itemsize)
+
+            my_file.create_dataset(
+                "table",
+                data=table,
+                chunks=(min(len(table), chunk_len),),
+                compression="gzip",
+                compression_opts=4,
+                shuffle=True,
+                track_times=False,
+            )
+
+    _logger.info(f"Wrote the data table to '{file}'.")
+
 
 # ============================= [ IO Strategy  ] ============================= #
 
@@ -227,6 +478,8 @@ hlp_lookup = get_func_lookup(globals_=globals(), prefix="hlp_")
 
 
 class PandasIO(DataIOStrategy[pd.DataFrame]):
+    __slots__ = []
+
     _sntp_loader: LoaderFuncType[pd.DataFrame] = hlp_lookup("from_sntp")
     _udst_loader: LoaderFuncType[pd.DataFrame] = hlp_lookup("from_udst")
     _hdf5_loader: LoaderFuncType[pd.DataFrame] = hlp_lookup("from_hdf5")
@@ -266,13 +519,58 @@ class PandasIO(DataIOStrategy[pd.DataFrame]):
         """
         return pd.DataFrame()
 
+    def _copy_table(self, table: pd.DataFrame) -> pd.DataFrame:
+        """\
+        Copy a data / cuts table.
+
+        Parameters
+        ----------
+        table : pd.DataFrame
+            The table to copy.
+
+        Returns
+        -------
+        pd.DataFrame
+            The copied table.
+
+        Notes
+        -----
+        With Pandas' Copy-on-Write (the default since Pandas 3.0), this is a
+        shallow copy, so the data is shared with the original table and is
+        only copied if one of the tables is modified. Otherwise (i.e. older
+        versions of Pandas), this is a deep copy.
+        """
+        return table.copy(deep=not _is_copy_on_write())
+
+    def _append_to_data_table(self, data: pd.DataFrame) -> None:
+        """\
+        Append the loaded data to the data table.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Loaded data.
+        """
+        # Note: The data table starts off empty, so for the first load we can
+        #       just use the loaded data (concatenating would copy all of it).
+
+        data_table = self._parent._data_table
+
+        if data_table.empty and not len(data_table.columns):
+            self._parent._data_table = data
+            return
+
+        self._parent._data_table = pd.concat(
+            [data_table, data], ignore_index=True
+        )
+
     def _from_sntp(self, files: list[str]) -> None:
         # We do not expect any `TransformMetadata` from the SNTP files.
         data, f_meta, _ = PandasIO._sntp_loader(
             variables=self._parent._variables, files=files
         )
 
-        self._parent._data_table = pd.concat([self._parent._data_table, data])
+        self._append_to_data_table(data=data)
         self._parent._f_metadata.extend(f_meta)
 
     def _from_udst(self, files: list[str]) -> None:
@@ -281,15 +579,16 @@ class PandasIO(DataIOStrategy[pd.DataFrame]):
             variables=self._parent._variables, files=files
         )
 
-        self._parent._data_table = pd.concat([self._parent._data_table, data])
+        self._append_to_data_table(data=data)
         self._parent._f_metadata.extend(f_meta)
 
     def _from_hdf5(self, files: list[str]) -> None:
-        data, f_meta, _ = self._hdf5_loader(
+        # We do not expect any `TransformMetadata` from the HDF5 files (yet).
+        data, f_meta, _ = PandasIO._hdf5_loader(
             variables=self._parent._variables, files=files
         )
 
-        self._parent._data_table = pd.concat([self._parent._data_table, data])
+        self._append_to_data_table(data=data)
         self._parent._f_metadata.extend(f_meta)
 
     def to_hdf5(self, file: str | Path) -> None:
@@ -301,7 +600,7 @@ class PandasIO(DataIOStrategy[pd.DataFrame]):
         file : str | Path
             The name of the HDF5 file to write to.
         """
-        return self._hdf5_writer(
+        return PandasIO._hdf5_writer(
             data=self._parent._data_table,
             file_metadata=self._parent._f_metadata,
             transform_metadata=self._parent._t_metadata,
@@ -15,9 +15,8 @@ transforms have been applied to both datasets.
 
 from __future__ import annotations
 
-# Note: There is a compatibility issue with `dataclasses`--in older versions of
-#       Python, the `slots` parameter is not available. I will solve this issue
-#       if it arises.
+# Note: The `slots` parameter of `dataclasses` needs Python 3.10+, which is the
+#       minimum Python version supported by Oscana.
 
 __all__ = []
 
@@ -32,6 +32,8 @@ class TransformBase(ABC):
     transform functions in the `DataHandler` class.
     """
 
+    __slots__ = ["_kwargs"]
+
     def __init__(self, **kwargs: Any) -> None:
         """\
         Initialize the transform function.
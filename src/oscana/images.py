@@ -19,16 +19,20 @@ __all__ = [
     "image_to_sparse",
 ]
 
+from typing import TYPE_CHECKING
+
 import logging
 
 import numpy as np
 import numpy.typing as npt
-import scipy.sparse as sps
 
 from .logger import _error
 from .utils import minos_numbers
 from .constants import IMAGE_DTYPE, EPlaneView
 
+if TYPE_CHECKING:
+    import scipy.sparse as sps
+
 # ================================ [ Logger ] ================================ #
 
 _logger = logging.getLogger("Root")
@@ -50,6 +54,10 @@ def image_to_sparse(image: npt.NDArray[IMAGE_DTYPE]) -> sps.csr_matrix:
     sps.csr_matrix
         The sparse matrix representation of the image.
     """
+    # Note: SciPy is only imported here as it is slow to import and it is not
+    #       needed anywhere else.
+    import scipy.sparse as sps
+
     return sps.csr_matrix(image, shape=image.shape, dtype=IMAGE_DTYPE)
 
 
@@ -22,14 +22,11 @@ from pathlib import Path
 
 # ============================== [ Constants  ] ============================== #
 
-# Note: A better way to do this would be using `importlib.resources.files` but
-#       I am currenly using Python 3.8 which does not seem to have this feature.
-#       The other option is to use `pkg_resources` but it is deprecated! So, for
-#       now, I am using `importlib.resources.path` and going back two
-#       directories to get the resources folder.
-
-with resources.path("oscana", "") as _path:
-    CONFIG_PATH = Path(_path).parent.parent / "res" / "configs"
+# Note: The resources folder sits two directories above the package directory,
+#       which we can get directly using `importlib.resources.files` (no need for
+#       the `importlib.resources.path` context manager or `pkg_resources`).
+
+CONFIG_PATH = Path(resources.files("oscana")).parent.parent / "res" / "configs"
 
 
 _STACK_LEVEL: int = 3
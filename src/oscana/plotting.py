@@ -36,9 +36,17 @@ __all__ = [
     "get_bin_centers",
 ]
 
-from typing import Generator, Literal, Any, TYPE_CHECKING
+from typing import (
+    Generator,
+    Literal,
+    Any,
+    Callable,
+    TypeAlias,
+    TYPE_CHECKING,
+)
 
 from contextlib import contextmanager
+from functools import lru_cache
 
 import logging, warnings
 
@@ -49,6 +57,7 @@ import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
 import matplotlib.scale as scl
 from matplotlib import patches
+from matplotlib.layout_engine import ConstrainedLayoutEngine
 
 from .logger import _error
 from .themes import _load_settings
@@ -69,45 +78,16 @@ _logger = logging.getLogger("Plot")
 # ============================== [ Constants  ] ============================== #
 
 # This "guessed" binning will be gone as soon as I find the actual binning...
-MINOS_GUESSED_ENERGY_BINS: list[float] = [
-    0,
-    1.0,
-    1.2666666666666666,
-    1.5333333333333332,
-    1.8,
-    2.0666666666666664,
-    2.333333333333333,
-    2.6,
-    2.8666666666666667,
-    3.1333333333333333,
-    3.4,
-    3.6666666666666665,
-    3.933333333333333,
-    4.2,
-    4.466666666666667,
-    4.733333333333333,
-    5.0,
-    5.555555555555555,
-    6.111111111111111,
-    6.666666666666667,
-    7.222222222222222,
-    7.777777777777778,
-    8.333333333333334,
-    8.88888888888889,
-    9.444444444444445,
-    10.0,
-    11.11111111111111,
-    12.222222222222221,
-    13.333333333333334,
-    14.444444444444445,
-    15.555555555555555,
-    16.666666666666668,
-    17.77777777777778,
-    18.88888888888889,
-    20,
-    30,
-    50,
-]
+MINOS_GUESSED_ENERGY_BINS: npt.NDArray[np.float64] = np.concatenate(
+    [
+        [0.0],
+        np.linspace(1.0, 5.0, 16),  # 0.27 GeV bins
+        np.linspace(5.0, 10.0, 10)[1:],  # 0.56 GeV bins
+        np.linspace(10.0, 20.0, 10)[1:],  # 1.11 GeV bins
+        [30.0, 50.0],
+    ]
+)
+MINOS_GUESSED_ENERGY_BINS.flags.writeable = False
 
 DEFAULT_X_AXIS_SEGMENTS: list[tuple[float, float, float]] = [
     (00, 10, 0.60),
@@ -117,6 +97,19 @@ DEFAULT_X_AXIS_SEGMENTS: list[tuple[float, float, float]] = [
 ]
 DEFAULT_X_AXIS_TICKS: list[float] = [0, 5, 10, 15, 20, 30, 50]
 
+# Figure keyword arguments which choose the layout engine.
+_LAYOUT_KWARGS: tuple[str, ...] = (
+    "layout",
+    "tight_layout",
+    "constrained_layout",
+)
+
+# Lookup arrays for the custom axis: (x_max, t_max, scale, fwd. intercept, inv.
+# intercept), where "t" is the value on the custom axis.
+_SegmentsLUT: TypeAlias = tuple[
+    np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray
+]
+
 # =========================== [ Helper Functions ] =========================== #
 
 
@@ -139,7 +132,7 @@ def _ensure_axs_tuple(axs: npt.NDArray | list[Axes] | Axes) -> tuple[Axes, ...]:
     # expected types
 
     if isinstance(axs, np.ndarray):
-        axs_return: tuple[Axes, ...] = tuple(axs.flatten().tolist())
+        axs_return: tuple[Axes, ...] = tuple(axs.ravel())
     elif isinstance(axs, list):
         axs_return: tuple[Axes, ...] = tuple(axs)
     else:
@@ -148,85 +141,107 @@ def _ensure_axs_tuple(axs: npt.NDArray | list[Axes] | Axes) -> tuple[Axes, ...]:
     return axs_return
 
 
-def _axs_fwd_transform(
-    segments: list[tuple[float, float, float]], array: npt.ArrayLike
-) -> np.ndarray:
+def _get_segments_lut(
+    segments: list[tuple[float, float, float]],
+) -> _SegmentsLUT:
     """\
-    Forward transform for the custom axis.
+    [ Internal ] Build the per-segment lookup arrays for the custom axis.
 
     Parameters
     ----------
     segments : List[Tuple[float, float, float]]
         The segments of the custom axis. Each segment is a tuple of the form: 
         (x_min, x_max, % of axis).
-        
-    array : npt.ArrayLike
-        The array to be transformed to the custom axis.
 
     Returns
     -------
-    np.ndarray
-        The array transformed to the custom axis.
+    tuple[np.ndarray, ...]
+        The segment upper edges (on both axes), scales and the intercepts of 
+        the forward and inverse transforms.
     """
-    array = np.asarray(array)
-    transformed_axis = np.zeros_like(array)
+    segments_array = np.asarray(segments, dtype=np.float64)
+
+    x_mins = segments_array[:, 0]
+    x_maxs = segments_array[:, 1]
+    fractions = segments_array[:, 2]
+
+    offsets = np.concatenate(([0.0], np.cumsum(fractions[:-1])))
+    scales = fractions / (x_maxs - x_mins)
+
+    # Note: Each segment is a straight line, i.e. t = x * scale + intercept.
+
+    return (
+        x_maxs,
+        offsets + fractions,
+        scales,
+        offsets - x_mins * scales,
+        x_mins - offsets / scales,
+    )
 
-    offset = 0
 
-    # Note: I wrote this code a really, really long time ago. Looking it at now,
-    #       I have no idea what it actually does, but it seems to be working
-    #       just fine.
+def _lut_fwd_transform(lut: _SegmentsLUT, array: npt.ArrayLike) -> np.ndarray:
+    """\
+    [ Internal ] Forward transform for the custom axis using pre-built lookup 
+    arrays (see `_get_segments_lut`).
+    """
+    x_maxs, _, scales, fwd_intercepts, _ = lut
 
-    for segment in segments:
-        idx = (array > segment[0]) & (array <= segment[1])
-        transformed_axis[idx] = offset + (
-            array[idx] - np.float64(segment[0])
-        ) * (segment[2] / (segment[1] - segment[0]))
+    array = np.asarray(array, dtype=np.float64)
 
-        offset += segment[2]
+    # Note: The segments are contiguous and sorted, so a single binary search
+    #       finds the segment of each value. Values outside of the segments are
+    #       extrapolated using the first / last segment.
 
-    _logger.debug("Applied the forward transform to compress the energy axis.")
+    i = np.clip(np.searchsorted(x_maxs, array, side="left"), 0, len(x_maxs) - 1)
+
+    transformed_axis = array * scales[i]
+    transformed_axis += fwd_intercepts[i]
 
     return transformed_axis
 
 
-def _axs_inv_transform(
-    segments: list[tuple[float, float, float]], array: npt.ArrayLike
-) -> np.ndarray:
+def _lut_inv_transform(lut: _SegmentsLUT, array: npt.ArrayLike) -> np.ndarray:
+    """\
+    [ Internal ] Inverse transform for the custom axis using pre-built lookup 
+    arrays (see `_get_segments_lut`).
+    """
+    _, t_maxs, scales, _, inv_intercepts = lut
+
+    array = np.asarray(array, dtype=np.float64)
+
+    i = np.clip(np.searchsorted(t_maxs, array, side="left"), 0, len(t_maxs) - 1)
+
+    original_axis = array / scales[i]
+    original_axis += inv_intercepts[i]
+
+    return original_axis
+
+
+@lru_cache(maxsize=None)
+def _get_segments_transforms(
+    segments: tuple[tuple[float, float, float], ...],
+) -> tuple[Callable[[npt.ArrayLike], np.ndarray], ...]:
     """\
-    Inverse transform for the custom axis.
+    [ Internal ] Get the forward and inverse transforms for the custom axis.
 
     Parameters
     ----------
-    segments : List[Tuple[float, float, float]]
+    segments : Tuple[Tuple[float, float, float], ...]
         The segments of the custom axis. Each segment is a tuple of the form: 
         (x_min, x_max, % of axis).
-        
-    array : npt.ArrayLike
-        The array to be transformed back to the original axis.
 
     Returns
     -------
-    np.ndarray
-        The array transformed back to the original axis.
+    tuple[Callable[[npt.ArrayLike], np.ndarray], ...]
+        The forward and inverse transforms.
     """
-    array = np.asarray(array)
-    original_axis = np.zeros_like(array)
-
-    offset = 0
-
-    for segment in segments:
-        idx = (array > segment[0]) & (array <= segment[1])
-        original_axis[idx] = segment[0] + (array[idx] - offset) / segment[2]
+    lut = _get_segments_lut(list(segments))
 
-        offset += segment[2]
-
-    _logger.debug(
-        "Applied the inverse transform to return the energy axis to normal."
+    return (
+        lambda x: _lut_fwd_transform(lut=lut, array=x),
+        lambda x: _lut_inv_transform(lut=lut, array=x),
     )
 
-    return original_axis
-
 
 # =============================== [ Context  ] =============================== #
 
@@ -243,36 +258,42 @@ def plotting_context(theme_name: str = "slate") -> Generator[None, None, None]:
     """
     settings = _load_settings(theme_name=theme_name.lower())
 
-    # Keep the original rcParameters so we can reset them later...
-    original_params = {setting: mpl.rcParams[setting] for setting in settings}
-
-    # Change the rcPrameters to our custom settings...
-    mpl.rcParams.update(settings)
+    # Change the rcPrameters to our custom settings (`rc_context` restores the
+    # original values on exit) and change warnings settings, so we don't keep
+    # getting the annoying "no artists found" warnings.
+    with mpl.rc_context(rc=settings), warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
 
-    # Change warnings settings, so we don't keep getting the annoying "no
-    # artists found" warnings.
-    warnings.simplefilter("ignore", UserWarning)
+        _logger.debug(
+            f"Entering the plotting context with '{theme_name}' theme. Warning "
+            "messages are temporarily supressed."
+        )
 
-    _logger.debug(
-        f"Entering the plotting context with '{theme_name}' theme. Warning "
-        "messages are temporarily supressed."
-    )
+        try:
+            yield  # Here, we are inside the context...
+        finally:
+            _logger.debug(
+                "Exiting the plotting context. Warning messages are now "
+                "enabled."
+            )
 
-    try:
-        yield  # Here, we are inside the context...
-    finally:
-        # Overwrite the rcParameters to their original values
-        mpl.rcParams.update(original_params)
 
-        # Unfilter warnings
-        warnings.simplefilter("default", UserWarning)
+# =============================== [ Layouts  ] =============================== #
 
-        _logger.debug(
-            "Exiting the plotting context. Warning messages are now enabled."
-        )
 
+def _set_default_layout(figure_kwargs: dict[str, Any]) -> None:
+    """\
+    [ Internal ] Use the constrained layout, unless a layout is already given.
 
-# =============================== [ Layouts  ] =============================== #
+    Parameters
+    ----------
+    figure_kwargs : dict[str, Any]
+        Keyword arguments for the Matplotlib `Figure` (modified in place).
+    """
+    # Note: Matplotlib warns if more than one of these is given, so the default
+    #       is only added if the caller has not chosen a layout themselves.
+    if not any(kwarg in figure_kwargs for kwarg in _LAYOUT_KWARGS):
+        figure_kwargs["layout"] = "constrained"
 
 
 def grid_layout(
@@ -304,6 +325,8 @@ def grid_layout(
     tuple[Figure, tuple[Axes, ...]]
         Matplotlib `Figure` object and a tuple of Matplotlib `Axes` object(s).
     """
+    _set_default_layout(figure_kwargs=figure_kwargs)
+
     fig, axs = plt.subplots(
         nrows=n_rows,
         ncols=n_cols,
@@ -338,6 +361,8 @@ def spectrum_layout(
     tuple[Figure, tuple[Axes, ...]]
         Matplotlib `Figure` object and a tuple of Matplotlib `Axes` object(s).
     """
+    _set_default_layout(figure_kwargs=figure_kwargs)
+
     fig = plt.figure(**figure_kwargs)
 
     gs = gridspec.GridSpec(
@@ -467,7 +492,7 @@ def energy_axs_scale(
     which_axis: Literal["x", "y"] = "x",
 ) -> None:
     """\
-    Set the x-axis scale for an energy spectrum plot.
+    Set the energy axis scale (x or y) for an energy spectrum plot.
 
     Parameters
     ----------
@@ -491,18 +516,25 @@ def energy_axs_scale(
     if x_ticks is None:
         x_ticks = DEFAULT_X_AXIS_TICKS
 
-    ax.set_xscale(
-        scl.FuncScale(
-            axis=(ax.xaxis if which_axis == "x" else ax.yaxis),
-            functions=(
-                lambda x: _axs_fwd_transform(segments=segments, array=x),
-                lambda x: _axs_inv_transform(segments=segments, array=x),
-            ),
-        )
+    # Note: `FuncScale` calls the transforms for every redraw (often with only
+    #       the tick positions), so the transforms (and their lookup arrays) are
+    #       built once for each set of segments.
+
+    functions = _get_segments_transforms(
+        segments=tuple(tuple(segment) for segment in segments)
     )
-    ax.set_xticks(x_ticks)
 
-    _logger.debug("Modified the energy x-axis.")
+    if which_axis == "x":
+        axis, set_scale = ax.xaxis, ax.set_xscale
+    else:
+        axis, set_scale = ax.yaxis, ax.set_yscale
+
+    set_scale(scl.FuncScale(axis=axis, functions=functions))
+
+    # Note: `set_ticks` also expands the view limits to show all of the ticks.
+    axis.set_ticks(x_ticks)  # pyright: ignore reportArgumentType
+
+    _logger.debug(f"Modified the energy {which_axis}-axis.")
 
 
 def spec_fig_cleanup(
@@ -529,13 +561,14 @@ def spec_fig_cleanup(
         Matplotlib `Axes` object for the resolution plot. Defaults to `None`.
     """
     axs_edge_colour = plt.rcParams["axes.edgecolor"]
+    axs_line_width = plt.rcParams["xtick.major.width"]
 
     if ax_ratio is not None:
         ax_ratio.axhline(
             0,
             color=axs_edge_colour,
             linestyle="dashed",
-            linewidth=plt.rcParams["xtick.major.width"],
+            linewidth=axs_line_width,
         )
         ax_energy.set_xticklabels([])
         ax_ratio.set_ylim(-1.0, 1.0)
@@ -546,22 +579,52 @@ def spec_fig_cleanup(
             0,
             color=axs_edge_colour,
             linestyle="dashed",
-            linewidth=plt.rcParams["xtick.major.width"],
+            linewidth=axs_line_width,
         )
         ax_resolution.yaxis.set_label_position("right")
         ax_resolution.tick_params(axis="y", labelleft=False, labelright=True)
         ax_resolution.set_xlim(-1, 1)
         ax_resolution.set_xticks([-0.5, 0, 0.5])
 
-    # Werid trick to make the plot fill the entire figure...
+    # Werid trick to join the subplots together...
 
-    fig.tight_layout()
+    # Note: `subplots_adjust` is ignored when the figure uses the constrained
+    #       layout, and the constrained layout always leaves a small gap
+    #       between the subplots. So the layout is run once (for the margins),
+    #       then turned off, and the ratio plot is stretched up to meet the
+    #       energy spectrum plot.
 
-    if ax_ratio is not None:
-        fig.subplots_adjust(hspace=0.0)
+    layout_engine = fig.get_layout_engine()
 
-    if ax_resolution is not None:
-        fig.subplots_adjust(wspace=0.05)
+    if isinstance(layout_engine, ConstrainedLayoutEngine):
+        if ax_ratio is not None:
+            layout_engine.set(h_pad=0.0, hspace=0.0)
+
+        if ax_resolution is not None:
+            layout_engine.set(wspace=0.05)
+
+        layout_engine.execute(fig)
+        fig.set_layout_engine("none")
+
+        if ax_ratio is not None:
+            energy_pos = ax_energy.get_position()
+            ratio_pos = ax_ratio.get_position()
+
+            ax_ratio.set_position(
+                (
+                    ratio_pos.x0,
+                    ratio_pos.y0,
+                    ratio_pos.width,
+                    energy_pos.y0 - ratio_pos.y0,
+                )
+            )
+
+    else:
+        if ax_ratio is not None:
+            fig.subplots_adjust(hspace=0.0)
+
+        if ax_resolution is not None:
+            fig.subplots_adjust(wspace=0.05)
 
     _logger.debug("Cleaned up the spectrum plot figure.")
 
@@ -654,18 +717,16 @@ def plot_energy_resolution(
 
     ax = axs[0]
 
-    reco_bin_heights, _, _ = ax.hist(
-        reco_energy,
-        bins=MINOS_GUESSED_ENERGY_BINS,
-        label="RECO.",
-    )
+    # Note: Binning with NumPy and drawing with `stairs` avoids creating a patch
+    #       for every bar (which is what `ax.hist` does).
 
-    mc_bin_heights, bin_edges, _ = ax.hist(
-        mc_energy,
-        bins=MINOS_GUESSED_ENERGY_BINS,
-        histtype="step",
-        label="MC",
+    reco_bin_heights, bin_edges = np.histogram(
+        reco_energy, bins=MINOS_GUESSED_ENERGY_BINS
     )
+    mc_bin_heights, _ = np.histogram(mc_energy, bins=MINOS_GUESSED_ENERGY_BINS)
+
+    ax.stairs(reco_bin_heights, bin_edges, fill=True, label="RECO.")
+    ax.stairs(mc_bin_heights, bin_edges, label="MC")
 
     energy_axs_scale(ax)
 
@@ -678,22 +739,41 @@ def plot_energy_resolution(
     ax.set_xlabel("Neutrino Energy, ".upper() + r"$E_\nu$ [GeV]")
     ax.set_ylabel("Ratio - 1".upper())
 
-    mc_bin_heights = np.asarray(mc_bin_heights)
-    reco_bin_heights = np.asarray(reco_bin_heights)
+    mc_bin_heights = np.asarray(mc_bin_heights, dtype=np.float64)
+    reco_bin_heights = np.asarray(reco_bin_heights, dtype=np.float64)
 
-    ax.plot(
-        get_bin_centers(bin_edges=bin_edges),
-        (mc_bin_heights / reco_bin_heights) - 1,
-        "o",
+    # Note: Empty reco. bins are set to NaN (so they are not plotted) instead of
+    #       dividing by zero.
+
+    ratio = (
+        np.divide(
+            mc_bin_heights,
+            reco_bin_heights,
+            out=np.full_like(mc_bin_heights, np.nan),
+            where=reco_bin_heights > 0,
+        )
+        - 1.0
     )
 
+    ax.plot(get_bin_centers(bin_edges=bin_edges), ratio, "o")
+
     energy_axs_scale(ax)
 
     ax = axs[2]
 
-    resolution = (mc_energy / reco_energy) - 1
-    mean_resolution = float(np.mean(resolution))
-    std_resolution = float(np.std(resolution))
+    # Same for the events with zero reco. energy - they are ignored.
+
+    resolution = (
+        np.divide(
+            mc_energy,
+            reco_energy,
+            out=np.full(np.shape(mc_energy), np.nan),
+            where=reco_energy != 0,
+        )
+        - 1.0
+    )
+    mean_resolution = float(np.nanmean(resolution))
+    std_resolution = float(np.nanstd(resolution))
 
     ax.hist(
         resolution,
@@ -852,4 +932,16 @@ def get_bin_centers(bin_edges: npt.ArrayLike) -> npt.NDArray:
     """
     bin_edges = np.asarray(bin_edges)
 
-    return (bin_edges[:-1] + bin_edges[1:]) / 2
+    # Note: Computed in-place to avoid allocating the intermediate arrays. The
+    #       dtype is the same as dividing by 2 (i.e. floating point bin edges
+    #       keep their dtype, and integer bin edges become `np.float64`).
+    dtype = (
+        bin_edges.dtype
+        if np.issubdtype(bin_edges.dtype, np.floating)
+        else np.float64
+    )
+
+    bin_centers = np.add(bin_edges[:-1], bin_edges[1:], dtype=dtype)
+    bin_centers *= 0.5
+
+    return bin_centers
@@ -20,8 +20,10 @@ __all__ = ["Theme", "themes"]
 from typing import Any
 
 import logging
+from pathlib import Path
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from matplotlib import cycler  # pyright: ignore reportAttributeAccessIssue
 from matplotlib import font_manager as fm
@@ -35,6 +37,9 @@ logger = logging.getLogger("Plot")
 
 DEFAULT_FIG_SIZE: tuple[float, float] = (7.5, 6.5)  # in
 
+# Fonts that have already been added to the Matplotlib font manager.
+_registered_fonts: set[Path] = set()
+
 # =========================== [ Theme Dataclass  ] =========================== #
 
 
@@ -96,6 +101,7 @@ class Theme:
 # =========================== [ Helper Functions ] =========================== #
 
 
+@lru_cache(maxsize=None)
 def _load_font(font_name: str) -> str:
     """\
     [Internal] Loads the font from the given path.
@@ -121,11 +127,17 @@ def _load_font(font_name: str) -> str:
             f"Font '{font_name}' not found. Defaulting to '{font.capitalize()}'"
             " font."
         )
+        return font
 
     font_object = fm.FontProperties(fname=font_as_path)  # type: ignore
     font = font_object.get_name()
 
-    fm.fontManager.addfont(font_as_path)
+    # Note: Adding a font invalidates Matplotlib's font lookup cache, so only do
+    #       it once per font file.
+
+    if font_as_path not in _registered_fonts:
+        fm.fontManager.addfont(font_as_path)
+        _registered_fonts.add(font_as_path)
 
     logger.debug(f"Loaded '{font_name}' font to Matplotlib.")
 
@@ -145,6 +157,11 @@ def _load_settings(theme_name: str) -> dict[str, Any]:
     -------
     dict[str, Any]
         Dictionary of Matplotlib settings for the given theme.
+
+    Notes
+    -----
+    The settings are compiled once per `Theme` object (see `_compiled_themes`),
+    so a new (mutable) copy is returned on each call.
     """
     theme = themes.get(theme_name, None)
 
@@ -154,9 +171,35 @@ def _load_settings(theme_name: str) -> dict[str, Any]:
         )
         theme = themes["draft"]
 
+    # Note: `Theme` is not hashable (`colour_cycle` is a list), so the settings
+    #       are cached by the identity of the theme. The theme is kept with its
+    #       settings, so that its `id` cannot be reused while it is cached.
+
+    cached = _compiled_themes.get(id(theme), None)
+
+    if cached is None:
+        cached = _compiled_themes[id(theme)] = (theme, _compile_settings(theme))
+
     logger.debug(f"Loaded '{theme_name}' theme settings.")
 
-    return {
+    return dict(cached[1])
+
+
+def _compile_settings(theme: Theme) -> dict[str, Any]:
+    """\
+    [Internal] Compiles the Matplotlib settings for the given theme.
+
+    Parameters
+    ----------
+    theme : Theme
+        The theme to compile.
+
+    Returns
+    -------
+    dict[str, Any]
+        Dictionary of Matplotlib settings for the given theme.
+    """
+    settings = {
         # Quality
         "figure.dpi": 100,
         "text.antialiased": True,
@@ -168,7 +211,7 @@ def _load_settings(theme_name: str) -> dict[str, Any]:
         "figure.facecolor": theme.face_colour,
         "figure.figsize": DEFAULT_FIG_SIZE,
         "figure.titlesize": int(theme.title_size * 1.5),
-        "figure.autolayout": True,  # Not sure if this will break anything...
+        "figure.constrained_layout.use": True,
         # Axes
         "axes.facecolor": theme.face_colour,
         "axes.edgecolor": theme.edge_colour,
@@ -223,6 +266,8 @@ def _load_settings(theme_name: str) -> dict[str, Any]:
         "legend.labelcolor": theme.text_colour,
     }
 
+    return settings
+
 
 # ================================ [ Themes ] ================================ #
 
@@ -286,3 +331,10 @@ themes = {
         cmap="viridis",
     ),
 }
+
+# Note: The settings (including the `cycler`) are only built the first time a
+#       theme is used, so entering the plotting context is usually just a
+#       dictionary lookup. Replacing a theme in `themes` is still picked up,
+#       because the cache is keyed on the `Theme` object and not on its name.
+
+_compiled_themes: dict[int, tuple[Theme, dict[str, Any]]] = {}
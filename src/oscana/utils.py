@@ -16,6 +16,7 @@ __all__ = [
     "init_env_variables",
     "init_minos_numbers",
     "get_func_lookup",
+    "map_enum_codes",
     "VariableSearchTool",
 ]
 
@@ -33,6 +34,7 @@ from typing_extensions import Literal as LiteralExt
 
 import os, platform, json, re
 from importlib import import_module
+from functools import lru_cache
 import logging
 from pathlib import Path
 
@@ -47,6 +49,7 @@ from .constants import RESOURCES_PATH
 
 if TYPE_CHECKING:
     from .data.transform import TransformBase
+    from .constants import _BaseEnum
 
 # =============================== [ Logging  ] =============================== #
 
@@ -283,6 +286,97 @@ def get_func_lookup(
     return func_lookup
 
 
+# ============================= [ Enum Lookups ] ============================= #
+
+
+@lru_cache(maxsize=None)
+def _get_enum_lut(
+    enum_cls: type[_BaseEnum],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.bool_], int]:
+    """\
+    [ Internal ]
+
+    Build the lookup table for an integer-valued Enum.
+
+    Parameters
+    ----------
+    enum_cls : type[_BaseEnum]
+        The Enum class.
+
+    Returns
+    -------
+    tuple[npt.NDArray[np.int64], npt.NDArray[np.bool_], int]
+        The lookup table of member values, a mask of which codes are members 
+        and the offset of the codes (i.e. the smallest member value).
+    """
+    values = [member.value for member in enum_cls]
+
+    if not all(isinstance(value, int) for value in values):
+        _error(
+            TypeError,
+            f"Enum `{enum_cls.__name__}` must only have integer values.",
+            _logger,
+        )
+
+    offset = min(values)
+
+    lut = np.zeros(max(values) - offset + 1, dtype=np.int64)
+    is_member = np.zeros(lut.size, dtype=np.bool_)
+
+    lut[np.asarray(values) - offset] = values
+    is_member[np.asarray(values) - offset] = True
+
+    return lut, is_member, offset
+
+
+def map_enum_codes(
+    enum_cls: type[_BaseEnum], codes: npt.ArrayLike
+) -> npt.NDArray[np.int64]:
+    """\
+    Map an array of integer codes onto the values of an Enum.
+
+    Parameters
+    ----------
+    enum_cls : type[_BaseEnum]
+        The integer-valued Enum class (e.g. `EIdHEP` or `EPlaneView`).
+
+    codes : npt.ArrayLike
+        The integer codes (e.g. the "stdhep.IdHEP" column).
+
+    Returns
+    -------
+    npt.NDArray[np.int64]
+        The Enum values of the codes. Codes which are not members are mapped to
+        the "unknown" member of the Enum.
+
+    Notes
+    -----
+    This gives the same result as `[enum_cls(code).value for code in codes]`
+    but uses a (cached) lookup table instead of creating an Enum per code.
+    """
+    lut, is_member, offset = _get_enum_lut(enum_cls)
+
+    idx = np.asarray(codes, dtype=np.int64) - offset
+    in_range = (idx >= 0) & (idx < lut.size)
+    idx = np.clip(idx, 0, lut.size - 1)
+
+    found = in_range & is_member[idx]
+
+    if np.all(found):
+        return lut[idx]
+
+    unknown = enum_cls._missing_(None)
+
+    if unknown is None:
+        _error(
+            ValueError,
+            f"Some codes are not valid `{enum_cls.__name__}` values.",
+            _logger,
+        )
+
+    return np.where(found, lut[idx], unknown.value)
+
+
 # =============================== [ Plugins  ] =============================== #
 
 
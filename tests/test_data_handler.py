@@ -0,0 +1,22 @@
+"""\
+tests / test_data_handler.py
+--------------------------------------------------------------------------------
+
+Author - Aditya Marathe
+Email  - aditya.marathe.20@ucl.ac.uk
+
+--------------------------------------------------------------------------------
+"""
+
+import pytest
+
+from oscana.utils import OscanaError
+from oscana.data.data_handler import DataHandler
+
+
+def test_unknown_data_io_plugin() -> None:
+    with pytest.raises(OscanaError, match="'NopeIO' not found") as excinfo:
+        DataHandler(variables=["NtpSt/stp.ph0.pe"], data_io="NopeIO")
+
+    # The internal lookup error should not be chained onto the error.
+    assert excinfo.value.__context__ is None
@@ -0,0 +1,91 @@
+"""\
+tests / test_f_metadata.py
+--------------------------------------------------------------------------------
+
+Author - Aditya Marathe
+Email  - aditya.marathe.20@ucl.ac.uk
+
+--------------------------------------------------------------------------------
+"""
+
+import pickle
+from datetime import datetime
+
+import pytest
+
+from oscana.data import f_metadata
+from oscana.data.f_metadata import FileMetadata
+
+FILE_NAME = "f21011001_0001_L010185N_D04_r1.sntp.dogwood5.0.root"
+
+
+def _make_f_metadata(file_name: str = FILE_NAME) -> FileMetadata:
+    parsed = f_metadata._parse_file_name_spill_daikon(file_name=file_name)
+    assert parsed is not None
+
+    return FileMetadata(
+        **parsed,
+        start_time=datetime(2009, 1, 1, 0, 0, 0),
+        end_time=datetime(2009, 1, 1, 1, 0, 0),
+        n_records=100,
+    )
+
+
+@pytest.fixture
+def metadata() -> FileMetadata:
+    return _make_f_metadata()
+
+
+def test_pickle_round_trip(metadata: FileMetadata) -> None:
+    # Only the `__init__` fields are pickled (not `_key`).
+    cls, args = metadata.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+
+    assert cls is FileMetadata
+    assert len(args) == len(f_metadata._f_metadata_init_fields)
+
+    loaded = pickle.loads(pickle.dumps(metadata))
+
+    assert loaded == metadata
+    assert loaded._key == metadata._key
+    assert loaded.create_time == metadata.create_time
+    assert loaded.to_dict() == metadata.to_dict()
+
+
+def test_to_table(metadata: FileMetadata) -> None:
+    other = _make_f_metadata(file_name=FILE_NAME.replace("L010", "H010"))
+
+    table = FileMetadata.to_table([metadata, other])
+
+    assert len(table) == 2
+    assert list(table.columns) == [
+        "file_name",
+        "file_format",
+        "file_type",
+        "experiment",
+        "detector",
+        "interaction",
+        "flavour",
+        "mag_field",
+        "horn_pos",
+        "tgt_z_shift",
+        "current_sign",
+        "current",
+        "run_number",
+        "mc_version",
+        "mc_version_number",
+        "reco_version",
+        "reco_version_number",
+        "start_time",
+        "end_time",
+        "n_records",
+        "create_time",
+    ]
+    assert table["horn_pos"].dtype == "category"
+    assert table["horn_pos"].tolist() == ["L", "H"]
+
+
+def test_to_table_empty() -> None:
+    table = FileMetadata.to_table([])
+
+    assert len(table) == 0
+    assert table["detector"].dtype == "category"
@@ -0,0 +1,57 @@
+"""\
+tests / test_lazy_imports.py
+--------------------------------------------------------------------------------
+
+Author - Aditya Marathe
+Email  - aditya.marathe.20@ucl.ac.uk
+
+--------------------------------------------------------------------------------
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code: str) -> str:
+    # Note: Each check runs in a new interpreter, so that the lazy modules have
+    #       not been imported already (e.g. by another test).
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_matplotlib() -> None:
+    assert (
+        _run("import sys, oscana; print('matplotlib' in sys.modules)")
+        == "False"
+    )
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import oscana; print(type(oscana.themes).__name__)",
+        "from oscana import themes; print(type(themes).__name__)",
+        "import oscana.plotting, oscana; print(type(oscana.themes).__name__)",
+        "import oscana.themes, oscana; print(type(oscana.themes).__name__)",
+        "import oscana.plotting; from oscana import themes; "
+        "print(type(themes).__name__)",
+    ],
+)
+def test_themes_is_the_dictionary_of_themes(code: str) -> None:
+    assert _run(code) == "dict"
+
+
+def test_plotting_is_the_module() -> None:
+    assert (
+        _run("import oscana.plotting, oscana; print(oscana.plotting.__name__)")
+        == "oscana.plotting"
+    )
@@ -0,0 +1,118 @@
+"""\
+tests / test_pandas_io.py
+--------------------------------------------------------------------------------
+
+Author - Aditya Marathe
+Email  - aditya.marathe.20@ucl.ac.uk
+
+--------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import pandas as pd
+import h5py
+import pytest
+
+from oscana.utils import OscanaError
+from oscana.data.plugins import pandas_io
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "stp.ph0.pe": np.linspace(0.0, 1.0, 10, dtype=np.float32),
+            "stp.time0": np.linspace(1e9, 1e9 + 1.0, 10),
+            "fHeader.fRun": np.arange(10, dtype=np.int32),
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_env_dirs(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The files are written to `tmp_path`, so there is no need for the '.env'.
+    monkeypatch.setattr(pandas_io, "_get_dir_from_env", lambda file: file)
+
+
+def test_hdf5_round_trip(data: pd.DataFrame, tmp_path) -> None:
+    file = str(tmp_path / "data.h5")
+
+    pandas_io.hlp_20250205_to_hdf5(
+        data=data, file_metadata=[], transform_metadata=None, file=file
+    )
+
+    with h5py.File(file, "r") as my_file:
+        assert list(my_file) == ["table"]
+        assert my_file["table"].dtype.names == tuple(data.columns)
+
+    loaded, f_metadata, t_metadata = pandas_io.hlp_20250205_from_hdf5(
+        variables=[f"NtpSt/{column}" for column in data.columns], files=[file]
+    )
+
+    pd.testing.assert_frame_equal(loaded, data)
+    assert f_metadata == []
+    assert t_metadata is None
+
+
+def test_hdf5_read_subset_of_fields(data: pd.DataFrame, tmp_path) -> None:
+    files = [str(tmp_path / "data_0.h5"), str(tmp_path / "data_1.h5")]
+
+    for file in files:
+        pandas_io.hlp_20250205_to_hdf5(
+            data=data, file_metadata=[], transform_metadata=None, file=file
+        )
+
+    # The fields are requested in a different order to the file.
+    loaded, _, _ = pandas_io.hlp_20250205_from_hdf5(
+        variables=["NtpSt/fHeader.fRun", "NtpSt/stp.time0"], files=files
+    )
+
+    expected = pd.concat(
+        [data[["fHeader.fRun", "stp.time0"]]] * 2, ignore_index=True
+    )
+
+    pd.testing.assert_frame_equal(loaded, expected)
+    assert loaded.dtypes.to_dict() == {
+        "fHeader.fRun": np.dtype(np.int32),
+        "stp.time0": np.dtype(np.float64),
+    }
+
+
+def test_hdf5_empty_table(data: pd.DataFrame, tmp_path) -> None:
+    file = str(tmp_path / "empty.h5")
+
+    pandas_io.hlp_20250205_to_hdf5(
+        data=data.iloc[:0], file_metadata=[], transform_metadata=None, file=file
+    )
+
+    loaded, _, _ = pandas_io.hlp_20250205_from_hdf5(
+        variables=["NtpSt/stp.ph0.pe"], files=[file]
+    )
+
+    assert len(loaded) == 0
+    assert loaded["stp.ph0.pe"].dtype == np.float32
+
+
+def test_hdf5_missing_variables(data: pd.DataFrame, tmp_path) -> None:
+    file = str(tmp_path / "data.h5")
+
+    pandas_io.hlp_20250205_to_hdf5(
+        data=data, file_metadata=[], transform_metadata=None, file=file
+    )
+
+    with pytest.raises(OscanaError, match="not found"):
+        pandas_io.hlp_20250205_from_hdf5(
+            variables=["NtpSt/stp.ph0.pe", "NtpSt/nope"], files=[file]
+        )
+
+
+def test_hdf5_jagged_columns_are_rejected(data: pd.DataFrame, tmp_path) -> None:
+    data["stp.strip"] = pd.Series([np.arange(i) for i in range(len(data))])
+
+    with pytest.raises(OscanaError, match="stp.strip"):
+        pandas_io.hlp_20250205_to_hdf5(
+            data=data,
+            file_metadata=[],
+            transform_metadata=None,
+            file=str(tmp_path / "jagged.h5"),
+        )
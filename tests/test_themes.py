@@ -0,0 +1,51 @@
+"""\
+tests / test_themes.py
+--------------------------------------------------------------------------------
+
+Author - Aditya Marathe
+Email  - aditya.marathe.20@ucl.ac.uk
+
+--------------------------------------------------------------------------------
+"""
+
+from importlib import import_module
+from dataclasses import replace
+
+import pytest
+
+# Note: `oscana.themes` is the dictionary of themes, so the module is imported
+#       by its full name.
+theme_module = import_module("oscana.themes")
+
+
+@pytest.fixture
+def themes(monkeypatch: pytest.MonkeyPatch) -> dict[str, theme_module.Theme]:
+    # The themes are restored after each test.
+    monkeypatch.setattr(theme_module, "themes", dict(theme_module.themes))
+    return theme_module.themes
+
+
+def test_replaced_theme_is_used(themes: dict[str, theme_module.Theme]) -> None:
+    assert theme_module._load_settings("slate")["axes.facecolor"] == "#1E1E1E"
+
+    themes["slate"] = replace(themes["slate"], face_colour="#123456")
+
+    settings = theme_module._load_settings("slate")
+
+    assert settings["axes.facecolor"] == "#123456"
+    assert settings["figure.facecolor"] == "#123456"
+
+
+def test_settings_are_copied(themes: dict[str, theme_module.Theme]) -> None:
+    settings = theme_module._load_settings("light")
+    settings["axes.facecolor"] = "#123456"
+
+    assert theme_module._load_settings("light")["axes.facecolor"] == "#FFFFFF"
+
+
+def test_unknown_theme_defaults_to_draft(
+    themes: dict[str, theme_module.Theme],
+) -> None:
+    assert theme_module._load_settings("nope") == theme_module._load_settings(
+        "draft"
+    )
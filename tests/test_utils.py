@@ -0,0 +1,46 @@
+"""\
+tests / test_utils.py
+--------------------------------------------------------------------------------
+
+Author - Aditya Marathe
+Email  - aditya.marathe.20@ucl.ac.uk
+
+--------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import pytest
+
+from oscana.constants import EIResonance, EIdHEP, EPlaneView
+from oscana.utils import map_enum_codes
+
+
+def test_map_enum_codes_matches_enum() -> None:
+    codes = np.array([13, -14, 2212, 0, 111, 99999, -1])
+
+    expected = [EIdHEP(int(code)).value for code in codes]
+
+    np.testing.assert_array_equal(map_enum_codes(EIdHEP, codes), expected)
+
+
+def test_map_enum_codes_unknown_codes() -> None:
+    np.testing.assert_array_equal(
+        map_enum_codes(EPlaneView, [0, 3, 6, 14, -5]),
+        [0, 3, EPlaneView.Unknown, EPlaneView.Unknown, EPlaneView.Unknown],
+    )
+
+
+def test_map_enum_codes_without_unknown_member() -> None:
+    np.testing.assert_array_equal(
+        map_enum_codes(EIResonance, [1001, 1005]), [1001, 1005]
+    )
+
+    with pytest.raises(ValueError, match="EIResonance"):
+        map_enum_codes(EIResonance, [1001, 1006])
+
+
+def test_map_enum_codes_empty() -> None:
+    result = map_enum_codes(EIdHEP, [])
+
+    assert result.shape == (0,)
+    assert result.dtype == np.int64